@@ -1,9 +1,35 @@
 # ABOUTME: Main package initialization for the LinkedIn scraper CLI tool.
 # ABOUTME: Exports version information from pyproject.toml.
 
-from importlib.metadata import version
+from typing import TYPE_CHECKING
 
-__version__ = version("linkedin-scraper")
+if TYPE_CHECKING:
+    __version__: str
+
+
+def __getattr__(name: str) -> str:
+    """Resolve __version__ on first access.
+
+    Reading the installed package metadata imports importlib.metadata, which is
+    a noticeable share of CLI startup, so it is deferred until the version is
+    actually needed (e.g. `--version`).
+
+    Args:
+        name: Attribute being looked up on the package.
+
+    Returns:
+        The installed package version for "__version__".
+
+    Raises:
+        AttributeError: For any other missing attribute.
+    """
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = version("linkedin-scraper")
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def hello() -> str:
@@ -2,5 +2,6 @@
 # ABOUTME: Provides CookieManager for secure LinkedIn cookie storage using OS keyring.
 
 from linkedin_scraper.auth.cookie_manager import CookieManager
+from linkedin_scraper.auth.validation_cache import ValidationCache
 
-__all__ = ["CookieManager"]
+__all__ = ["CookieManager", "ValidationCache"]
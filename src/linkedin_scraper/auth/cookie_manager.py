@@ -2,10 +2,17 @@
 # ABOUTME: Uses OS keyring for secure storage and maintains a list of account names.
 
 import json
+import os
+import tempfile
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
-import keyring
+# keyring is imported inside the methods that use it: loading its backends is slow and
+# commands that only read accounts.json should not pay for it.
+
+# Shared encoder for accounts.json; json.dumps builds a new encoder per call when indenting
+_ACCOUNTS_ENCODER = json.JSONEncoder(indent=2)
 
 
 class CookieManager:
@@ -25,6 +32,11 @@ class CookieManager:
         self.accounts_file = (
             accounts_file if accounts_file is not None else self.DEFAULT_ACCOUNTS_FILE
         )
+        # Parsed accounts list, keyed on the file's stat stamp so external writes invalidate it
+        self._accounts_cache: set[str] | None = None
+        self._accounts_stamp: tuple[int, int, int] | None = None
+        # Raw keyring values already read by this instance, keyed by account name
+        self._stored_cache: dict[str, str] = {}
 
     def validate_cookie_format(self, cookie: str) -> bool:
         """Validate the format of a LinkedIn cookie.
@@ -37,7 +49,7 @@ class CookieManager:
         Returns:
             True if the cookie format appears valid, False otherwise.
         """
-        if not cookie or not cookie.strip():
+        if not cookie or len(cookie) < self.MIN_COOKIE_LENGTH:
             return False
         return len(cookie.strip()) >= self.MIN_COOKIE_LENGTH
 
@@ -48,7 +60,10 @@ class CookieManager:
             cookie: The li_at cookie value to store.
             account_name: Name to identify this account. Defaults to "default".
         """
+        import keyring
+
         keyring.set_password(self.SERVICE_NAME, account_name, cookie)
+        self._stored_cache[account_name] = cookie
         self._add_account_to_list(account_name)
 
     def store_cookies(
@@ -61,8 +76,11 @@ class CookieManager:
             jsessionid: The JSESSIONID cookie value.
             account_name: Name to identify this account. Defaults to "default".
         """
+        import keyring
+
         cookie_data = json.dumps({"li_at": li_at, "JSESSIONID": jsessionid})
         keyring.set_password(self.SERVICE_NAME, account_name, cookie_data)
+        self._stored_cache[account_name] = cookie_data
         self._add_account_to_list(account_name)
 
     def get_cookie(self, account_name: str = "default") -> str | None:
@@ -76,17 +94,18 @@ class CookieManager:
         Returns:
             The li_at cookie string if found, None otherwise.
         """
-        stored = keyring.get_password(self.SERVICE_NAME, account_name)
+        stored = self._get_stored(account_name)
         if stored is None:
             return None
 
-        # Try to parse as JSON (new format)
-        try:
-            data = json.loads(stored)
-            if isinstance(data, dict):
-                return data.get("li_at")
-        except json.JSONDecodeError:
-            pass
+        # Try to parse as JSON (new format); legacy values never start with "{"
+        if stored.lstrip().startswith("{"):
+            try:
+                data = json.loads(stored)
+                if isinstance(data, dict):
+                    return data.get("li_at")
+            except json.JSONDecodeError:
+                pass
 
         # Fall back to treating it as a plain li_at string (legacy format)
         return stored
@@ -101,17 +120,18 @@ class CookieManager:
             Dictionary with 'li_at' and 'JSESSIONID' keys if found, None otherwise.
             If only li_at is stored (legacy format), JSESSIONID will be missing.
         """
-        stored = keyring.get_password(self.SERVICE_NAME, account_name)
+        stored = self._get_stored(account_name)
         if stored is None:
             return None
 
-        # Try to parse as JSON (new format)
-        try:
-            data = json.loads(stored)
-            if isinstance(data, dict) and "li_at" in data:
-                return {"li_at": data["li_at"], "JSESSIONID": data.get("JSESSIONID", "")}
-        except json.JSONDecodeError:
-            pass
+        # Try to parse as JSON (new format); legacy values never start with "{"
+        if stored.lstrip().startswith("{"):
+            try:
+                data = json.loads(stored)
+                if isinstance(data, dict) and "li_at" in data:
+                    return {"li_at": data["li_at"], "JSESSIONID": data.get("JSESSIONID", "")}
+            except json.JSONDecodeError:
+                pass
 
         # Fall back to treating it as a plain li_at string (legacy format)
         return {"li_at": stored, "JSESSIONID": ""}
@@ -122,14 +142,40 @@ class CookieManager:
         Args:
             account_name: Name of the account to delete. Defaults to "default".
         """
+        import keyring
+
         keyring.delete_password(self.SERVICE_NAME, account_name)
+        self._stored_cache.pop(account_name, None)
         self._remove_account_from_list(account_name)
 
+    def _get_stored(self, account_name: str) -> str | None:
+        """Read the raw keyring value for an account, memoized per instance.
+
+        Each keyring lookup is an IPC round-trip to the OS credential store, so
+        repeated reads of the same account reuse the first result. Misses are
+        not memoized, so cookies stored later by another instance or process are
+        still found. Writes through this instance update or drop the memoized value.
+
+        Args:
+            account_name: Name of the account to read.
+
+        Returns:
+            The stored string, or None if nothing is stored for the account.
+        """
+        stored = self._stored_cache.get(account_name)
+        if stored is None:
+            import keyring
+
+            stored = keyring.get_password(self.SERVICE_NAME, account_name)
+            if stored is not None:
+                self._stored_cache[account_name] = stored
+        return stored
+
     def list_accounts(self) -> list[str]:
         """List all stored account names.
 
         Returns:
-            List of account names that have stored cookies.
+            Sorted list of account names that have stored cookies.
         """
         return self._load_accounts()
 
@@ -137,32 +183,89 @@ class CookieManager:
         """Load account names from the accounts file.
 
         Returns:
-            List of account names, or empty list if file doesn't exist or is empty/invalid.
+            Sorted list of account names, or empty list if file doesn't exist or is empty/invalid.
         """
-        if not self.accounts_file.exists():
-            return []
+        return sorted(self._load_account_set())
+
+    def _load_account_set(self) -> set[str]:
+        """Load account names from the accounts file as a set.
+
+        The parsed set is cached in memory and reused until the file's
+        modification time, size or inode changes, so repeated calls within one
+        process avoid re-reading and re-parsing the file. Size and inode catch
+        rewrites that land within the filesystem's timestamp granularity.
+
+        Returns:
+            Set of account names, or empty set if file doesn't exist or is empty/invalid.
+        """
+        try:
+            stamp = self._stat_stamp()
+        except OSError:
+            self._invalidate_accounts_cache()
+            return set()
+
+        if self._accounts_cache is not None and stamp == self._accounts_stamp:
+            return self._accounts_cache.copy()
 
         try:
             content = self.accounts_file.read_text().strip()
             if not content:
-                return []
+                return set()
             data: dict[str, Any] = json.loads(content)
             accounts = data.get("accounts", [])
             if isinstance(accounts, list):
-                return [str(acc) for acc in accounts]
-            return []
+                self._accounts_cache = {str(acc) for acc in accounts}
+                self._accounts_stamp = stamp
+                return self._accounts_cache.copy()
+            return set()
         except (json.JSONDecodeError, OSError):
-            return []
+            return set()
 
-    def _save_accounts(self, accounts: list[str]) -> None:
+    def _save_accounts(self, accounts: Iterable[str]) -> None:
         """Save account names to the accounts file.
 
+        Accounts are written in sorted order so the file contents are deterministic.
+        The payload is serialized up front, written to a sibling temp file in a
+        single call, and moved into place so a crash never leaves a partial file.
+        Each save uses its own temp file, so concurrent CLI processes can't move
+        each other's half-written file into place.
+
         Args:
-            accounts: List of account names to save.
+            accounts: Account names to save.
         """
+        account_set = set(accounts)
+        payload = _ACCOUNTS_ENCODER.encode({"accounts": sorted(account_set)})
         self.accounts_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.accounts_file, "w") as f:
-            json.dump({"accounts": accounts}, f, indent=2)
+        # The temp file is removed on exit unless it has already been moved into place
+        with tempfile.NamedTemporaryFile(
+            "w",
+            dir=self.accounts_file.parent,
+            prefix=f"{self.accounts_file.name}.",
+            suffix=".tmp",
+            delete_on_close=False,
+        ) as tmp_file:
+            tmp_file.write(payload)
+            tmp_file.close()
+            os.replace(tmp_file.name, self.accounts_file)
+        self._accounts_cache = account_set
+        self._accounts_stamp = self._stat_stamp()
+
+    def _stat_stamp(self) -> tuple[int, int, int]:
+        """Identify the current version of the accounts file from its metadata.
+
+        Returns:
+            Tuple of (modification time in ns, size in bytes, inode).
+
+        Raises:
+            OSError: If the file can't be stat'ed, e.g. it doesn't exist.
+        """
+        st = os.stat(self.accounts_file)
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def _invalidate_accounts_cache(self) -> None:
+        """Drop the in-memory accounts list so the next load re-reads the file."""
+        self._accounts_cache = None
+        self._accounts_stamp = None
 
     def _add_account_to_list(self, account_name: str) -> None:
         """Add an account name to the accounts list if not already present.
@@ -170,9 +273,9 @@ class CookieManager:
         Args:
             account_name: The account name to add.
         """
-        accounts = self._load_accounts()
+        accounts = self._load_account_set()
         if account_name not in accounts:
-            accounts.append(account_name)
+            accounts.add(account_name)
             self._save_accounts(accounts)
 
     def _remove_account_from_list(self, account_name: str) -> None:
@@ -181,7 +284,7 @@ class CookieManager:
         Args:
             account_name: The account name to remove.
         """
-        accounts = self._load_accounts()
+        accounts = self._load_account_set()
         if account_name in accounts:
-            accounts.remove(account_name)
+            accounts.discard(account_name)
             self._save_accounts(accounts)
@@ -0,0 +1,145 @@
+# ABOUTME: Short-lived on-disk cache of LinkedIn session validation results.
+# ABOUTME: Lets `status --account` skip the network round-trip for recently validated sessions.
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+
+class ValidationCache:
+    """Cache of recently validated sessions, stored as a small JSON file.
+
+    Only successful validations are cached. Each entry records a fingerprint of
+    the li_at cookie it was validated with, so storing new cookies for an
+    account (e.g. after logging in again) makes the old entry miss.
+    """
+
+    DEFAULT_TTL_SECONDS = 15 * 60
+
+    def __init__(self, cache_file: Path, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> None:
+        """Initialize the validation cache.
+
+        Args:
+            cache_file: Path to the JSON file holding cached entries.
+            ttl_seconds: How long a successful validation stays trusted.
+                Defaults to 15 minutes.
+        """
+        self.cache_file = cache_file
+        self.ttl_seconds = ttl_seconds
+
+    def is_valid(self, account_name: str, li_at: str) -> bool:
+        """Check whether a session was validated recently.
+
+        Args:
+            account_name: Name of the account to look up.
+            li_at: The account's current li_at cookie.
+
+        Returns:
+            True if an unexpired entry exists for this account and cookie,
+            False otherwise.
+        """
+        entry = self._load().get(account_name)
+        if not isinstance(entry, dict):
+            return False
+        return entry.get("fingerprint") == self._fingerprint(li_at) and self._is_live(
+            entry.get("expires_at"), time.time()
+        )
+
+    def mark_valid(self, account_name: str, li_at: str) -> None:
+        """Record a successful validation for an account.
+
+        Args:
+            account_name: Name of the validated account.
+            li_at: The li_at cookie that was validated.
+        """
+        entries = self._load()
+        entries[account_name] = {
+            "fingerprint": self._fingerprint(li_at),
+            "expires_at": time.time() + self.ttl_seconds,
+        }
+        self._save(entries)
+
+    def invalidate(self, account_name: str) -> None:
+        """Drop any cached validation for an account.
+
+        Args:
+            account_name: Name of the account to drop.
+        """
+        entries = self._load()
+        if entries.pop(account_name, None) is not None:
+            self._save(entries)
+
+    @staticmethod
+    def _is_live(expires_at: Any, now: float) -> bool:
+        """Check whether an entry's expiry time is well-formed and in the future.
+
+        Args:
+            expires_at: The entry's expires_at value as read from disk.
+            now: The current time, as returned by time.time().
+
+        Returns:
+            True if expires_at is a number later than now, False otherwise.
+        """
+        return isinstance(expires_at, int | float) and expires_at > now
+
+    @staticmethod
+    def _fingerprint(li_at: str) -> str:
+        """Hash a cookie so the cache file never holds the cookie itself.
+
+        Args:
+            li_at: The li_at cookie value.
+
+        Returns:
+            Hex digest identifying the cookie.
+        """
+        return hashlib.sha256(li_at.encode()).hexdigest()
+
+    def _load(self) -> dict[str, Any]:
+        """Load cached entries from disk.
+
+        Returns:
+            Mapping of account name to entry, or empty dict if the file is
+            missing or invalid.
+        """
+        try:
+            data = json.loads(self.cache_file.read_text())
+        except (json.JSONDecodeError, OSError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self, entries: dict[str, Any]) -> None:
+        """Write entries to disk, dropping any that have expired.
+
+        The payload goes to a uniquely named sibling temp file first and is moved
+        into place, so neither a crash nor a concurrent run leaves a partial
+        file. The cache is only an optimization, so if it can't be written the
+        entries are dropped.
+
+        Args:
+            entries: Mapping of account name to entry.
+        """
+        now = time.time()
+        live = {
+            name: entry
+            for name, entry in entries.items()
+            if isinstance(entry, dict) and self._is_live(entry.get("expires_at"), now)
+        }
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # The temp file is removed on exit unless it has already been moved into place
+            with tempfile.NamedTemporaryFile(
+                "w",
+                dir=self.cache_file.parent,
+                prefix=f"{self.cache_file.name}.",
+                suffix=".tmp",
+                delete_on_close=False,
+            ) as tmp_file:
+                tmp_file.write(json.dumps(live))
+                tmp_file.close()
+                os.replace(tmp_file.name, self.cache_file)
+        except OSError:
+            pass
@@ -1,41 +1,26 @@
 # ABOUTME: CLI skeleton for LinkedIn connection search tool using Typer.
 # ABOUTME: Provides login, search, export, and status commands with ToS acceptance flow.
 
+import functools
+import os
+import time
 import urllib.error
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
-from rich.table import Table
-
-from linkedin_scraper import __version__
-from linkedin_scraper.auth import CookieManager
-from linkedin_scraper.config import Settings, get_settings
-from linkedin_scraper.database import DatabaseService
-from linkedin_scraper.database.stats import get_database_stats
-from linkedin_scraper.display import ConnectionTable
-from linkedin_scraper.display.errors import (
-    display_cookie_help,
-    display_error,
-    display_network_error,
-    display_rate_limit_exceeded,
-)
-from linkedin_scraper.display.status import display_rate_limit_warning
-from linkedin_scraper.export.csv_exporter import CSVExporter
-from linkedin_scraper.linkedin.client import LinkedInClient
-from linkedin_scraper.linkedin.exceptions import (
-    LinkedInAuthError,
-    LinkedInRateLimitError,
-)
-from linkedin_scraper.models import ConnectionProfile
-from linkedin_scraper.rate_limit.display import RateLimitDisplay
-from linkedin_scraper.rate_limit.exceptions import RateLimitExceeded
-from linkedin_scraper.rate_limit.service import RateLimiter
-from linkedin_scraper.search.filters import NetworkDepth
-from linkedin_scraper.search.orchestrator import SearchOrchestrator
+
+# Service modules (settings, SQLModel, linkedin-api, Rich) are imported inside the command
+# handlers that use them so `--help`, `--version` and cheap commands start fast.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.text import Text
+
+    from linkedin_scraper.auth.cookie_manager import CookieManager
+    from linkedin_scraper.config import Settings
+    from linkedin_scraper.database.service import DatabaseService
+    from linkedin_scraper.search.filters import NetworkDepth
 
 # Global debug state (set via --debug flag)
 _debug_mode: bool = False
@@ -51,6 +36,8 @@ def _version_callback(value: bool) -> None:
         typer.Exit: Exits after printing version.
     """
     if value:
+        from linkedin_scraper import __version__
+
         typer.echo(f"linkedin-scraper {__version__}")
         raise typer.Exit()
 
@@ -62,7 +49,39 @@ app = typer.Typer(
     rich_markup_mode="rich",
 )
 
-console = Console()
+
+@functools.cache
+def _get_console() -> "Console":
+    """Get the shared Rich console, importing Rich on first use.
+
+    Output already carries explicit markup, so Rich's automatic highlighting and
+    emoji code replacement are disabled. This also keeps profile text such as
+    ":rocket:" in a headline from being rewritten.
+
+    Returns:
+        The process-wide Console instance.
+    """
+    from rich.console import Console
+
+    return Console(highlight=False, emoji=False)
+
+
+@functools.cache
+def _get_db_service(db_path: Path) -> "DatabaseService":
+    """Get an initialized DatabaseService for a path, creating it once per process.
+
+    Args:
+        db_path: Path to the SQLite database file.
+
+    Returns:
+        DatabaseService whose tables have been created.
+    """
+    from linkedin_scraper.database.service import DatabaseService
+
+    db_service = DatabaseService(db_path=db_path)
+    db_service.init_db()
+    return db_service
+
 
 TOS_WARNING_TEXT = """[bold yellow]⚠️  Terms of Service Warning[/bold yellow]
 
@@ -77,6 +96,25 @@ This tool uses an unofficial LinkedIn API and may violate LinkedIn's Terms of Se
 [bold red]Use at your own risk.[/bold red]"""
 
 
+@functools.cache
+def _tos_panel() -> "Panel":
+    """Build the ToS warning panel once and reuse it for later prompts.
+
+    The markup is parsed into a Text up front; a plain string would be re-parsed
+    every time the panel is rendered.
+
+    Returns:
+        Rich Panel wrapping TOS_WARNING_TEXT.
+    """
+    from rich.panel import Panel
+    from rich.text import Text
+
+    return Panel(
+        Text.from_markup(TOS_WARNING_TEXT), title="LinkedIn Scraper", border_style="yellow"
+    )
+
+
+@functools.cache
 def get_cookie_instructions() -> str:
     """Return instructions for extracting LinkedIn cookies from a browser.
 
@@ -97,32 +135,165 @@ def get_cookie_instructions() -> str:
 [dim]Note: Both cookies are required. They expire periodically.[/dim]"""
 
 
-def _save_tos_acceptance(settings: Settings) -> None:
-    """Save ToS acceptance to environment-compatible format.
+@functools.cache
+def _cookie_instructions_text() -> "Text":
+    """Parse the cookie instructions markup once for all instruction panels.
+
+    Returns:
+        Rich Text built from get_cookie_instructions().
+    """
+    from rich.text import Text
+
+    return Text.from_markup(get_cookie_instructions())
+
+
+@functools.cache
+def _cookie_instructions_panel(title: str, border_style: str) -> "Panel":
+    """Build a cookie instructions panel once per title/style pair.
+
+    Args:
+        title: Panel title.
+        border_style: Rich style for the panel border.
+
+    Returns:
+        Rich Panel wrapping the cookie instructions.
+    """
+    from rich.panel import Panel
+
+    return Panel(_cookie_instructions_text(), title=title, border_style=border_style)
+
 
-    Since pydantic-settings doesn't persist values back to files automatically,
-    we rely on the environment variable override mechanism. For now, this is
-    a no-op as the acceptance is session-based unless env vars are set.
+def _print_fresh_cookie_help() -> None:
+    """Print the instructions for replacing expired or rejected cookies."""
+    console = _get_console()
+    console.print()
+    console.print(_cookie_instructions_panel("How to Get Fresh Cookies", "yellow"))
+
+
+def _prompt_cookie(cookie_manager: "CookieManager", name: str) -> str:
+    """Prompt for one cookie value without echo and check its format.
+
+    Each cookie is checked right after it is entered so a bad paste fails before
+    the user is asked for the next one.
+
+    Args:
+        cookie_manager: Cookie manager used to validate the format.
+        name: Cookie name shown in the prompt and error message.
+
+    Returns:
+        The entered cookie value.
+
+    Raises:
+        typer.Exit: If the value does not look like a valid cookie.
+    """
+    from rich.prompt import Prompt
 
-    In a full implementation, this would write to a config file.
+    value = Prompt.ask(f"[bold]Paste your {name} cookie value[/bold]", password=True)
+    if not cookie_manager.validate_cookie_format(value):
+        _get_console().print(
+            f"[red]Error: Invalid {name} cookie format.[/red]\n"
+            "[dim]The cookie should be at least 10 characters long.[/dim]"
+        )
+        raise typer.Exit(code=1)
+    return value
+
+
+def _tos_file(settings: "Settings") -> Path:
+    """Get the path of the file recording ToS acceptance.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        Path to tos.json next to the database.
     """
-    # The ToS acceptance is handled via environment variables for testing.
-    # In production, this would write to a persistent config file.
-    pass
+    return settings.db_path.parent / "tos.json"
+
 
+def _load_tos_acceptance(settings: "Settings") -> bool:
+    """Check whether ToS acceptance was saved by an earlier run.
+
+    Args:
+        settings: Application settings.
 
-def _check_tos_acceptance() -> bool:
+    Returns:
+        True if the acceptance file exists and records acceptance, False otherwise.
+    """
+    import json
+
+    try:
+        data = json.loads(_tos_file(settings).read_text())
+    except (json.JSONDecodeError, OSError):
+        return False
+    return isinstance(data, dict) and data.get("accepted") is True
+
+
+def _save_tos_acceptance(settings: "Settings") -> None:
+    """Save ToS acceptance so later runs don't prompt again.
+
+    The record is written to a uniquely named sibling temp file and moved into
+    place, so neither a crash nor a concurrent first run leaves a partial file.
+    If it can't be written, acceptance only lasts for the current run.
+
+    Args:
+        settings: Application settings.
+    """
+    import json
+    import tempfile
+    from datetime import UTC, datetime
+
+    tos_file = _tos_file(settings)
+    payload = json.dumps({"accepted": True, "accepted_at": datetime.now(UTC).isoformat()})
+    try:
+        tos_file.parent.mkdir(parents=True, exist_ok=True)
+        # The temp file is removed on exit unless it has already been moved into place
+        with tempfile.NamedTemporaryFile(
+            "w",
+            dir=tos_file.parent,
+            prefix=f"{tos_file.name}.",
+            suffix=".tmp",
+            delete_on_close=False,
+        ) as tmp_file:
+            tmp_file.write(payload)
+            tmp_file.close()
+            os.replace(tmp_file.name, tos_file)
+    except OSError:
+        pass
+
+
+# Values pydantic parses as True for a bool field, lower-cased
+_TRUTHY_ENV_VALUES = frozenset({"1", "on", "t", "true", "y", "yes"})
+
+
+def _check_tos_acceptance(settings: "Settings | None" = None) -> bool:
     """Check and prompt for ToS acceptance if needed.
 
+    A truthy LINKEDIN_SCRAPER_TOS_ACCEPTED environment variable is checked first so
+    scripted runs skip loading Settings entirely. Acceptance given at the prompt
+    is saved and honoured by later runs.
+
+    Args:
+        settings: Settings already loaded by the calling command. Loaded on demand
+            if omitted.
+
     Returns:
         True if ToS is accepted, False otherwise.
     """
-    settings = get_settings()
+    env_value = os.environ.get("LINKEDIN_SCRAPER_TOS_ACCEPTED", "")
+    if env_value.strip().lower() in _TRUTHY_ENV_VALUES:
+        return True
 
-    if settings.tos_accepted:
+    if settings is None:
+        from linkedin_scraper.config import get_settings
+
+        settings = get_settings()
+    if settings.tos_accepted or _load_tos_acceptance(settings):
         return True
 
-    console.print(Panel(TOS_WARNING_TEXT, title="LinkedIn Scraper", border_style="yellow"))
+    from rich.prompt import Confirm
+
+    console = _get_console()
+    console.print(_tos_panel())
     console.print()
 
     accepted = Confirm.ask("[bold]Do you accept these terms and wish to continue?[/bold]")
@@ -147,6 +318,16 @@ def _handle_error(error: Exception) -> None:
     """
     global _debug_mode
 
+    from linkedin_scraper.display.errors import (
+        display_cookie_help,
+        display_error,
+        display_network_error,
+        display_rate_limit_exceeded,
+    )
+    from linkedin_scraper.linkedin.exceptions import LinkedInAuthError, LinkedInRateLimitError
+    from linkedin_scraper.rate_limit.exceptions import RateLimitExceeded
+
+    console = _get_console()
     if isinstance(error, LinkedInAuthError):
         console.print(display_error(error, verbose=_debug_mode))
         console.print()
@@ -154,9 +335,8 @@ def _handle_error(error: Exception) -> None:
         console.print()
         console.print(display_cookie_help())
     elif isinstance(error, RateLimitExceeded):
-        reset_time = getattr(error, "reset_time", None)
-        if reset_time:
-            console.print(display_rate_limit_exceeded(reset_time))
+        if error.reset_time is not None:
+            console.print(display_rate_limit_exceeded(error.reset_time))
         else:
             console.print(display_error(error, verbose=_debug_mode))
     elif isinstance(error, LinkedInRateLimitError):
@@ -164,8 +344,15 @@ def _handle_error(error: Exception) -> None:
         console.print(
             "[dim]LinkedIn's rate limit was triggered. Wait a few minutes and try again.[/dim]"
         )
-    elif isinstance(error, (urllib.error.URLError, ConnectionError, OSError)):
+    elif isinstance(error, (urllib.error.URLError, ConnectionError, TimeoutError)):
         console.print(display_network_error(error))
+    elif isinstance(error, OSError):
+        # Any other OSError comes from the local filesystem, e.g. the data directory
+        console.print(display_error(error, verbose=_debug_mode))
+        console.print(
+            "[yellow]A local file could not be read or written. Check that the data "
+            "directory exists, is writable and has free space.[/yellow]"
+        )
     else:
         console.print(display_error(error, verbose=_debug_mode))
         if _debug_mode:
@@ -221,7 +408,7 @@ def main(
     _debug_mode = debug
 
     if ctx.invoked_subcommand is None:
-        console.print("[dim]Use --help to see available commands.[/dim]")
+        _get_console().print("[dim]Use --help to see available commands.[/dim]")
 
 
 @app.command()
@@ -261,27 +448,19 @@ def login(
     if not _check_tos_acceptance():
         raise typer.Exit(code=1)
 
-    cookie_manager = CookieManager()
+    from rich.console import Group
 
-    console.print()
-    console.print(
-        Panel(get_cookie_instructions(), title="Cookie Instructions", border_style="cyan")
-    )
-    console.print()
+    from linkedin_scraper.auth.cookie_manager import CookieManager
+    from linkedin_scraper.linkedin.client import LinkedInClient
+    from linkedin_scraper.linkedin.exceptions import LinkedInAuthError
 
-    li_at = Prompt.ask("[bold]Paste your li_at cookie value[/bold]", password=True)
-
-    if not cookie_manager.validate_cookie_format(li_at):
-        console.print("[red]Error: Invalid li_at cookie format.[/red]")
-        console.print("[dim]The cookie should be at least 10 characters long.[/dim]")
-        raise typer.Exit(code=1)
+    console = _get_console()
+    cookie_manager = CookieManager()
 
-    jsessionid = Prompt.ask("[bold]Paste your JSESSIONID cookie value[/bold]", password=True)
+    console.print(Group("", _cookie_instructions_panel("Cookie Instructions", "cyan"), ""))
 
-    if not cookie_manager.validate_cookie_format(jsessionid):
-        console.print("[red]Error: Invalid JSESSIONID cookie format.[/red]")
-        console.print("[dim]The cookie should be at least 10 characters long.[/dim]")
-        raise typer.Exit(code=1)
+    li_at = _prompt_cookie(cookie_manager, "li_at")
+    jsessionid = _prompt_cookie(cookie_manager, "JSESSIONID")
 
     if validate:
         console.print("[dim]Validating cookies with LinkedIn...[/dim]")
@@ -290,51 +469,70 @@ def login(
             if not client.validate_session():
                 console.print("[red]Error: Cookie validation failed.[/red]")
                 console.print("[yellow]The cookies may be expired or invalid.[/yellow]")
-                console.print()
-                console.print(
-                    Panel(
-                        get_cookie_instructions(),
-                        title="How to Get Fresh Cookies",
-                        border_style="yellow",
-                    )
-                )
+                _print_fresh_cookie_help()
                 raise typer.Exit(code=1)
         except LinkedInAuthError as e:
             console.print(f"[red]Error: Authentication failed - {e}[/red]")
-            console.print()
-            console.print(
-                Panel(
-                    get_cookie_instructions(),
-                    title="How to Get Fresh Cookies",
-                    border_style="yellow",
-                )
-            )
+            _print_fresh_cookie_help()
             raise typer.Exit(code=1) from None
 
     cookie_manager.store_cookies(li_at, jsessionid, account)
     console.print(f"[green]Success! Cookies stored for account '[bold]{account}[/bold]'.[/green]")
 
 
-def _parse_degrees(degree_str: str) -> list[NetworkDepth]:
-    """Parse comma-separated degree string into NetworkDepth list.
+# Default --degree value: 1st and 2nd degree connections
+_DEFAULT_DEGREES = "1,2"
+
+
+@functools.cache
+def _degree_lookup() -> tuple["NetworkDepth", ...]:
+    """Build the degree digit to NetworkDepth table on first use.
+
+    Returns:
+        Tuple indexed by degree (1-3); index 0 is unused.
+    """
+    from linkedin_scraper.search.filters import NetworkDepth
+
+    return (NetworkDepth.FIRST, NetworkDepth.FIRST, NetworkDepth.SECOND, NetworkDepth.THIRD)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_degrees(degree_str: str) -> tuple["NetworkDepth", ...]:
+    """Parse comma-separated degree string into a tuple of NetworkDepth values.
+
+    Scans the string once without splitting. Each comma-separated token must be
+    a single digit 1-3 (surrounding whitespace allowed); other tokens are ignored
+    and repeated degrees are only returned once. Results are memoized since the
+    set of distinct inputs is tiny.
 
     Args:
         degree_str: Comma-separated string of degrees (e.g., "1,2" or "1,2,3").
 
     Returns:
-        List of NetworkDepth enum values.
+        Tuple of NetworkDepth enum values.
     """
-    degree_map = {
-        "1": NetworkDepth.FIRST,
-        "2": NetworkDepth.SECOND,
-        "3": NetworkDepth.THIRD,
-    }
-    depths = []
-    for part in degree_str.split(","):
-        part = part.strip()
-        if part in degree_map:
-            depths.append(degree_map[part])
-    return depths if depths else [NetworkDepth.FIRST, NetworkDepth.SECOND]
+    lookup = _degree_lookup()
+    if degree_str == _DEFAULT_DEGREES:
+        # Common case: the option was not given, so skip the scan
+        return (lookup[1], lookup[2])
+
+    depths: list[NetworkDepth] = []
+    seen = 0
+    # Degree read for the current token: 0 if none yet, -1 if the token is invalid
+    token = 0
+    for char in f"{degree_str},":
+        if char == ",":
+            if token > 0 and not seen & (1 << token):
+                seen |= 1 << token
+                depths.append(lookup[token])
+            token = 0
+        elif char.isspace():
+            continue
+        elif token == 0 and char in "123":
+            token = ord(char) - ord("0")
+        else:
+            token = -1
+    return tuple(depths) if depths else (lookup[1], lookup[2])
 
 
 @app.command()
@@ -370,7 +568,7 @@ def search(
             "-d",
             help="Connection degrees, comma-separated (e.g., '1,2' for 1st and 2nd).",
         ),
-    ] = "1,2",
+    ] = _DEFAULT_DEGREES,
     limit: Annotated[
         int,
         typer.Option(
@@ -406,61 +604,67 @@ def search(
         [cyan]linkedin-scraper search -k "data scientist" --limit 50 -a work[/cyan]
             Search with custom limit using 'work' account.
     """
-    if not _check_tos_acceptance():
-        raise typer.Exit(code=1)
+    from linkedin_scraper.config import get_settings
 
     settings = get_settings()
-    db_service = DatabaseService(db_path=settings.db_path)
-    db_service.init_db()
-    rate_limiter = RateLimiter(db_service, settings)
-    cookie_manager = CookieManager()
-    orchestrator = SearchOrchestrator(db_service, rate_limiter, cookie_manager)
+    if not _check_tos_acceptance(settings):
+        raise typer.Exit(code=1)
+
+    from rich.console import Group, RenderableType
+
+    from linkedin_scraper.auth.cookie_manager import CookieManager
+    from linkedin_scraper.display.status import display_rate_limit_warning
+    from linkedin_scraper.display.tables import ConnectionTable
+    from linkedin_scraper.rate_limit.service import RateLimiter
+    from linkedin_scraper.search.orchestrator import SearchOrchestrator
+
+    console = _get_console()
 
     # Parse degree filter
-    network_depths = _parse_degrees(degree)
+    network_depths = list(_parse_degrees(degree))
 
     console.print(f"[dim]Searching for '{keywords}'...[/dim]")
 
     try:
-        profiles = orchestrator.execute_search_with_company_name(
-            keywords=keywords,
-            company_name=company,
-            location=location,
-            network_depths=network_depths,
-            limit=limit,
-            account=account,
+        # Services are built inside the try so setup failures (e.g. an unwritable
+        # database path) are reported like any other search error
+        db_service = _get_db_service(settings.db_path)
+        orchestrator = SearchOrchestrator(
+            db_service, RateLimiter(db_service, settings), CookieManager()
         )
-    except (
-        LinkedInAuthError,
-        RateLimitExceeded,
-        LinkedInRateLimitError,
-        urllib.error.URLError,
-        ConnectionError,
-        OSError,
-    ) as e:
-        _handle_error(e)
+        # The rate-limit delay and network calls take seconds; show a spinner meanwhile
+        with console.status("[dim]Searching LinkedIn...[/dim]", spinner="dots"):
+            profiles = orchestrator.execute_search_with_company_name(
+                keywords=keywords,
+                company_name=company,
+                location=location,
+                network_depths=network_depths,
+                limit=limit,
+                account=account,
+            )
     except Exception as e:
+        # _handle_error picks the message for each error type
         _handle_error(e)
 
-    # Display results
+    # Collect results and rate limit status so Rich renders and flushes them once
+    output: list[RenderableType] = []
     if profiles:
         connection_table = ConnectionTable()
-        table = connection_table.render(profiles, title="Search Results")
-        console.print(table)
-        console.print()
-        console.print(f"[green]Found {len(profiles)} result(s).[/green]")
+        output.append(connection_table.render(profiles, title="Search Results"))
+        output.append("")
+        output.append(f"[green]Found {len(profiles)} result(s).[/green]")
     else:
-        console.print("[yellow]No results found.[/yellow]")
+        output.append("[yellow]No results found.[/yellow]")
 
-    # Show rate limit status
     remaining = orchestrator.get_remaining_actions()
     warning_panel = display_rate_limit_warning(remaining)
     if warning_panel:
-        console.print()
-        console.print(warning_panel)
+        output.append("")
+        output.append(warning_panel)
     else:
-        msg = f"[dim]Remaining searches today: [green]{remaining}[/green][/dim]"
-        console.print(msg)
+        output.append(f"[dim]Remaining searches today: [green]{remaining}[/green][/dim]")
+
+    console.print(Group(*output))
 
 
 def _generate_default_export_path() -> Path:
@@ -469,10 +673,12 @@ def _generate_default_export_path() -> Path:
     Returns:
         Path to the default export file.
     """
-    from datetime import UTC, datetime
-
-    timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-    return Path(f"linkedin_export_{timestamp}.csv")
+    # time.gmtime gives UTC fields without building a tz-aware datetime
+    now = time.gmtime()
+    return Path(
+        f"linkedin_export_{now.tm_year:04d}{now.tm_mon:02d}{now.tm_mday:02d}"
+        f"_{now.tm_hour:02d}{now.tm_min:02d}{now.tm_sec:02d}.csv"
+    )
 
 
 @app.command()
@@ -504,6 +710,7 @@ def export(
         int | None,
         typer.Option(
             "--limit",
+            min=0,
             help="Maximum number of records to export.",
         ),
     ] = None,
@@ -527,37 +734,31 @@ def export(
         [cyan]linkedin-scraper export --limit 100 -o top100.csv[/cyan]
             Export only the first 100 records.
     """
-    if not _check_tos_acceptance():
-        raise typer.Exit(code=1)
+    from linkedin_scraper.config import get_settings
 
     settings = get_settings()
-    db_service = DatabaseService(db_path=settings.db_path)
-    db_service.init_db()
+    if not _check_tos_acceptance(settings):
+        raise typer.Exit(code=1)
 
-    # Determine output path
-    output_path = output if output is not None else _generate_default_export_path()
+    from linkedin_scraper.export.csv_exporter import CSVExporter
 
-    # Fetch profiles based on filters
-    profiles: list[ConnectionProfile]
-    query_info: str | None = None
+    console = _get_console()
+    db_service = _get_db_service(settings.db_path)
 
-    if query:
-        profiles = db_service.get_connections_by_query(query, limit=limit)
-        query_info = query
-    else:
-        # Default: export all (or limited)
-        if limit is not None:
-            profiles = db_service.get_connections(limit=limit)
-        else:
-            # Get all connections - use a large limit
-            profiles = db_service.get_connections(limit=100000)
+    # Determine output path
+    output_path = output if output is not None else _generate_default_export_path()
 
-    # Export to CSV
+    # Stream matching rows from the database rather than loading them all;
+    # an empty query exports everything. The count comes from the same read
+    # transaction as the rows, so the metadata row always matches them.
+    query_info = query or None
     exporter = CSVExporter()
-    result_path = exporter.export(profiles, output_path, query_info=query_info)
+    with db_service.read_connections(limit=limit, query=query_info) as (record_count, profiles):
+        result_path = exporter.export(
+            profiles, output_path, query_info=query_info, record_count=record_count
+        )
 
     # Display results
-    record_count = len(profiles)
     if record_count == 0:
         console.print("[yellow]No records to export.[/yellow]")
     else:
@@ -565,7 +766,19 @@ def export(
     console.print(f"  [cyan]{result_path}[/cyan]")
 
 
-def _render_database_stats_panel(stats: dict[str, object]) -> Panel:
+# Ordinal labels indexed by connection degree; higher degrees fall back to "Nth"
+_DEGREE_ORDINAL = ("0th", "1st", "2nd", "3rd")
+
+# (label, stats key) pairs rendered as the count rows of the database panel
+_STATS_ROWS = (
+    ("Total Connections:", "total_connections"),
+    ("Unique Companies:", "unique_companies"),
+    ("Unique Locations:", "unique_locations"),
+    ("Search Queries:", "recent_searches_count"),
+)
+
+
+def _render_database_stats_panel(stats: dict[str, object]) -> "Panel":
     """Render database statistics as a Rich Panel.
 
     Args:
@@ -574,31 +787,27 @@ def _render_database_stats_panel(stats: dict[str, object]) -> Panel:
     Returns:
         Rich Panel containing formatted database statistics.
     """
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(show_header=False, box=None, padding=(0, 1))
     table.add_column("Label", style="dim")
     table.add_column("Value")
 
-    total = stats.get("total_connections", 0)
-    table.add_row("Total Connections:", f"[cyan]{total}[/cyan]")
-
-    companies = stats.get("unique_companies", 0)
-    table.add_row("Unique Companies:", f"[cyan]{companies}[/cyan]")
-
-    locations = stats.get("unique_locations", 0)
-    table.add_row("Unique Locations:", f"[cyan]{locations}[/cyan]")
-
-    searches = stats.get("recent_searches_count", 0)
-    table.add_row("Search Queries:", f"[cyan]{searches}[/cyan]")
+    # Pre-styled Text cells skip Rich's markup parser
+    for label, key in _STATS_ROWS:
+        table.add_row(Text(label), Text(str(stats.get(key, 0)), style="cyan"))
 
     # Degree distribution
     degree_dist = stats.get("degree_distribution", {})
     if degree_dist and isinstance(degree_dist, dict):
         degree_parts = []
         for degree, count in sorted(degree_dist.items()):
-            degree_label = {1: "1st", 2: "2nd", 3: "3rd"}.get(degree, f"{degree}th")
+            degree_label = _DEGREE_ORDINAL[degree] if 0 <= degree <= 3 else f"{degree}th"
             degree_parts.append(f"{degree_label}: {count}")
         if degree_parts:
-            table.add_row("By Degree:", ", ".join(degree_parts))
+            table.add_row(Text("By Degree:"), Text(", ".join(degree_parts)))
 
     return Panel(
         table,
@@ -608,19 +817,48 @@ def _render_database_stats_panel(stats: dict[str, object]) -> Panel:
     )
 
 
+def _validate_session(cookies: dict[str, str]) -> bool:
+    """Check whether stored cookies still give an authenticated LinkedIn session.
+
+    Args:
+        cookies: Cookies as returned by CookieManager.get_cookies.
+
+    Returns:
+        True if the session is valid, False if it is expired or rejected.
+    """
+    from linkedin_scraper.linkedin.client import LinkedInClient
+    from linkedin_scraper.linkedin.exceptions import LinkedInAuthError
+
+    try:
+        client = LinkedInClient(cookies["li_at"], cookies.get("JSESSIONID"))
+        return client.validate_session()
+    except LinkedInAuthError:
+        return False
+
+
+# Account status cells for the accounts panel
+_STATUS_VALID = "[green]Valid[/green]"
+_STATUS_INVALID = "[red]Expired/Invalid[/red]"
+_STATUS_UNCHECKED = "[dim]Not checked[/dim]"
+
+
 def _render_accounts_panel(
     accounts: list[str],
-    validation_result: tuple[str, bool] | None = None,
-) -> Panel:
+    validation_results: dict[str, bool] | None = None,
+) -> "Panel":
     """Render stored accounts as a Rich Panel.
 
     Args:
         accounts: List of stored account names.
-        validation_result: Optional tuple of (account_name, is_valid) for a validated account.
+        validation_results: Optional mapping of account name to session validity for
+            the accounts that were validated.
 
     Returns:
         Rich Panel containing formatted account list.
     """
+    from rich.panel import Panel
+    from rich.table import Table
+
     content: str | Table
     if not accounts:
         content = "[dim]No accounts stored. Run 'linkedin-scraper login' to add one.[/dim]"
@@ -629,12 +867,13 @@ def _render_accounts_panel(
         table.add_column("Account", style="cyan")
         table.add_column("Status", style="dim")
 
+        results = validation_results or {}
         for account in accounts:
-            if validation_result and validation_result[0] == account:
-                is_valid = validation_result[1]
-                status_text = "[green]Valid[/green]" if is_valid else "[red]Expired/Invalid[/red]"
+            is_valid = results.get(account)
+            if is_valid is None:
+                status_text = _STATUS_UNCHECKED
             else:
-                status_text = "[dim]Not checked[/dim]"
+                status_text = _STATUS_VALID if is_valid else _STATUS_INVALID
             table.add_row(account, status_text)
 
         content = table
@@ -674,50 +913,78 @@ def status(
         [cyan]linkedin-scraper status --account work[/cyan]
             Validate the 'work' account's session.
     """
-    if not _check_tos_acceptance():
-        raise typer.Exit(code=1)
+    from linkedin_scraper.config import get_settings
 
     settings = get_settings()
-    db_service = DatabaseService(db_path=settings.db_path)
-    db_service.init_db()
-    cookie_manager = CookieManager()
+    if not _check_tos_acceptance(settings):
+        raise typer.Exit(code=1)
 
-    # Rate limit status
-    rate_limiter = RateLimiter(db_service, settings)
-    rate_display = RateLimitDisplay(rate_limiter)
-    console.print(rate_display.render_status())
-    console.print()
+    from concurrent.futures import Future, ThreadPoolExecutor
 
-    # Database statistics
-    stats = get_database_stats(db_service)
-    console.print(_render_database_stats_panel(stats))
-    console.print()
+    from rich.console import Group, RenderableType
 
-    # Account status
-    accounts = cookie_manager.list_accounts()
-    validation_result: tuple[str, bool] | None = None
+    from linkedin_scraper.auth.cookie_manager import CookieManager
+    from linkedin_scraper.auth.validation_cache import ValidationCache
+    from linkedin_scraper.database.stats import get_database_stats
+    from linkedin_scraper.rate_limit.display import RateLimitDisplay
+    from linkedin_scraper.rate_limit.service import RateLimiter
 
+    console = _get_console()
+    db_service = _get_db_service(settings.db_path)
+    cookie_manager = CookieManager()
+    validation_cache = ValidationCache(settings.db_path.parent / "validation_cache.json")
+
+    cookies: dict[str, str] | None = None
+    is_valid = False
     if account:
-        # Validate specific account
         cookies = cookie_manager.get_cookies(account)
-        if cookies is None:
-            console.print(f"[yellow]Account '{account}' not found. No cookies stored.[/yellow]")
-        else:
-            console.print(f"[dim]Validating session for '{account}'...[/dim]")
-            try:
-                client = LinkedInClient(cookies["li_at"], cookies.get("JSESSIONID"))
-                is_valid = client.validate_session()
-                validation_result = (account, is_valid)
+        # Sessions validated within the last few minutes skip the network call
+        is_valid = cookies is not None and validation_cache.is_valid(account, cookies["li_at"])
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Start the network check first so it overlaps the local database queries
+        pending: Future[bool] | None = None
+        if cookies is not None and not is_valid:
+            pending = executor.submit(_validate_session, cookies)
+
+        # Sections are collected and printed as one Group so Rich renders and flushes once
+        rate_limiter = RateLimiter(db_service, settings)
+        rate_display = RateLimitDisplay(rate_limiter)
+        stats = get_database_stats(db_service)
+        output: list[RenderableType] = [
+            rate_display.render_status(),
+            "",
+            _render_database_stats_panel(stats),
+            "",
+        ]
+
+        # Account status
+        accounts = cookie_manager.list_accounts()
+        validation_results: dict[str, bool] = {}
+
+        if account:
+            if cookies is None:
+                output.append(f"[yellow]Account '{account}' not found. No cookies stored.[/yellow]")
+            else:
+                if pending is not None:
+                    # Flush what is ready so the progress line shows while the check finishes
+                    output.append(f"[dim]Validating session for '{account}'...[/dim]")
+                    console.print(Group(*output))
+                    output = []
+                    is_valid = pending.result()
+                    if is_valid:
+                        validation_cache.mark_valid(account, cookies["li_at"])
+                    else:
+                        validation_cache.invalidate(account)
+                validation_results[account] = is_valid
                 if is_valid:
-                    console.print(f"[green]Session for '{account}' is valid and active.[/green]")
+                    output.append(f"[green]Session for '{account}' is valid and active.[/green]")
                 else:
-                    console.print(f"[red]Session for '{account}' is expired or not valid.[/red]")
-            except LinkedInAuthError:
-                validation_result = (account, False)
-                console.print(f"[red]Session for '{account}' is expired or not valid.[/red]")
-        console.print()
+                    output.append(f"[red]Session for '{account}' is expired or not valid.[/red]")
+            output.append("")
 
-    console.print(_render_accounts_panel(accounts, validation_result))
+    output.append(_render_accounts_panel(accounts, validation_results))
+    console.print(Group(*output))
 
 
 if __name__ == "__main__":
@@ -55,7 +55,9 @@ def get_settings() -> Settings:
     """Get the application settings.
 
     Returns a cached Settings instance. Use get_settings.cache_clear()
-    to clear the cache if needed.
+    to clear the cache if needed. Commands should call this once and pass the
+    instance (or the fields they need) down to helpers and services, rather
+    than calling it again at each use.
 
     Returns:
         Cached Settings instance.
@@ -1,15 +1,96 @@
 # ABOUTME: Database service for managing SQLite connections and CRUD operations.
 # ABOUTME: Provides session management and persistence for ConnectionProfile and RateLimitEntry.
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterable, Iterator
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
-from sqlmodel import Session, SQLModel, create_engine, select
+from sqlalchemy import Engine, event, insert
+from sqlmodel import Session, SQLModel, create_engine, func, select
 
 from linkedin_scraper.models import ActionType, ConnectionProfile, RateLimitEntry
 
+# Applied to every new SQLite connection. WAL with synchronous=NORMAL fsyncs at
+# checkpoints rather than on every commit, and lets readers run alongside a writer.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Tune a freshly opened SQLite connection.
+
+    Args:
+        dbapi_connection: The raw sqlite3 connection.
+        connection_record: SQLAlchemy's pool record for the connection (unused).
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+# Engines shared by every service pointing at the same database file, keyed by
+# resolved path. Released with dispose_engines().
+_engines: dict[str, Engine] = {}
+
+_MEMORY_DB = ":memory:"
+
+
+def _create_engine(location: str) -> Engine:
+    """Create an engine for a SQLite database with the connection pragmas applied.
+
+    Args:
+        location: Database file path, or ":memory:" for an in-memory database.
+
+    Returns:
+        Engine for the database.
+    """
+    engine = create_engine(f"sqlite:///{location}", echo=False)
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+def _engine_for(db_path: Path) -> Engine:
+    """Get the engine for a database path.
+
+    Services pointing at the same file share one engine, and so one connection
+    pool, which keeps SQLite's page cache warm across them. In-memory databases
+    are private to each service, so they always get a fresh engine.
+
+    Args:
+        db_path: Path to the SQLite database file, or Path(":memory:").
+
+    Returns:
+        Engine for the database.
+    """
+    if str(db_path) == _MEMORY_DB:
+        return _create_engine(_MEMORY_DB)
+    location = str(db_path.resolve())
+    engine = _engines.get(location)
+    if engine is None:
+        engine = _engines[location] = _create_engine(location)
+    return engine
+
+
+def dispose_engines() -> None:
+    """Close the pooled connections of every shared engine and forget them.
+
+    Services created afterwards get new engines; existing services keep working
+    and reopen connections on demand.
+    """
+    engines = list(_engines.values())
+    _engines.clear()
+    for engine in engines:
+        engine.dispose()
+
 
 class DatabaseService:
     """Service for managing database connections and operations."""
@@ -23,12 +104,25 @@ class DatabaseService:
             db_path: Path to the SQLite database file. Defaults to ~/.linkedin-scraper/data.db
         """
         self.db_path = db_path if db_path is not None else self.DEFAULT_DB_PATH
-        self._engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
+        self._engine = _engine_for(self.db_path)
+        self._initialized = False
 
     def init_db(self) -> None:
-        """Initialize the database by creating tables and parent directories."""
+        """Initialize the database by creating tables, indexes and parent directories.
+
+        Safe to call repeatedly; only the first call per instance touches the disk.
+        Indexes are created separately from tables so databases made by older
+        versions pick up indexes added since.
+        """
+        if self._initialized:
+            return
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         SQLModel.metadata.create_all(self._engine)
+        with self._engine.begin() as connection:
+            for table in SQLModel.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(connection, checkfirst=True)
+        self._initialized = True
 
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
@@ -55,6 +149,32 @@ class DatabaseService:
             session.refresh(profile)
             return profile
 
+    def save_connections(
+        self, profiles: Iterable[ConnectionProfile], batch_size: int = 500
+    ) -> list[ConnectionProfile]:
+        """Save several connection profiles, committing once per batch.
+
+        Each commit is a SQLite transaction with its own fsync, so saving a
+        search's results in batches is much cheaper than one commit per row.
+        Each batch is a single executemany INSERT that bypasses the session's
+        unit of work, so the profiles are never attached to a session. Their
+        IDs are assigned client-side, so the returned objects are complete.
+
+        Args:
+            profiles: The ConnectionProfiles to save.
+            batch_size: Maximum number of profiles per transaction.
+
+        Returns:
+            The saved profiles, in the order given.
+        """
+        saved = list(profiles)
+        with Session(self._engine) as session:
+            for start in range(0, len(saved), batch_size):
+                rows = [profile.model_dump() for profile in saved[start : start + batch_size]]
+                session.execute(insert(ConnectionProfile), rows)
+                session.commit()
+        return saved
+
     def get_connections(self, limit: int = 100, offset: int = 0) -> list[ConnectionProfile]:
         """Retrieve connection profiles from the database.
 
@@ -70,6 +190,44 @@ class DatabaseService:
             results = session.exec(statement)
             return list(results.all())
 
+    @contextmanager
+    def read_connections(
+        self, limit: int | None = None, batch_size: int = 500, query: str | None = None
+    ) -> Generator[tuple[int, Iterator[ConnectionProfile]], None, None]:
+        """Count and stream connection profiles from one consistent snapshot.
+
+        The count and the rows are read inside a single read transaction, so the
+        count always matches the rows yielded even if another process writes
+        meanwhile. Rows are fetched from SQLite batch_size at a time, so memory
+        use stays bounded regardless of how many profiles are stored. The
+        iterator must be consumed before the context exits.
+
+        Args:
+            limit: Maximum number of profiles to yield, or None for all.
+            batch_size: Number of rows to fetch per round-trip.
+            query: Only yield profiles found by this search query, or None for all.
+
+        Yields:
+            Tuple of (number of profiles the iterator yields, iterator of
+            ConnectionProfile objects in storage order).
+        """
+        with self.get_session() as session:
+            # pysqlite does not open a transaction for SELECTs, so each query
+            # would otherwise see its own snapshot
+            session.connection().exec_driver_sql("BEGIN")
+
+            count_statement = select(func.count()).select_from(ConnectionProfile)
+            statement = select(ConnectionProfile).execution_options(yield_per=batch_size)
+            if query is not None:
+                count_statement = count_statement.where(ConnectionProfile.search_query == query)
+                statement = statement.where(ConnectionProfile.search_query == query)
+
+            count = session.exec(count_statement).one()
+            if limit is not None:
+                count = min(count, limit)
+                statement = statement.limit(limit)
+            yield count, iter(session.exec(statement))
+
     def get_connection_by_urn(self, urn_id: str) -> ConnectionProfile | None:
         """Retrieve a connection profile by its LinkedIn URN ID.
 
@@ -118,6 +276,25 @@ class DatabaseService:
             session.refresh(entry)
             return entry
 
+    def save_rate_limit_entries(
+        self, entries: Iterable[RateLimitEntry], batch_size: int = 500
+    ) -> list[RateLimitEntry]:
+        """Save several rate limit entries, committing once per batch.
+
+        Args:
+            entries: The RateLimitEntries to save.
+            batch_size: Maximum number of entries per transaction.
+
+        Returns:
+            The saved entries, in the order given.
+        """
+        saved = list(entries)
+        with Session(self._engine, expire_on_commit=False) as session:
+            for start in range(0, len(saved), batch_size):
+                session.add_all(saved[start : start + batch_size])
+                session.commit()
+        return saved
+
     def get_rate_limit_entries_since(
         self,
         since: datetime,
@@ -138,3 +315,58 @@ class DatabaseService:
                 statement = statement.where(RateLimitEntry.action_type == action_type)
             results = session.exec(statement)
             return list(results.all())
+
+    def count_rate_limit_entries_since(
+        self,
+        since: datetime,
+        action_type: ActionType | None = None,
+    ) -> int:
+        """Count rate limit entries since a given time without loading them.
+
+        Args:
+            since: Datetime to count entries from.
+            action_type: Optional action type to filter by.
+
+        Returns:
+            Number of matching entries.
+        """
+        with self.get_session() as session:
+            statement = (
+                select(func.count())
+                .select_from(RateLimitEntry)
+                .where(RateLimitEntry.timestamp >= since)
+            )
+            if action_type is not None:
+                statement = statement.where(RateLimitEntry.action_type == action_type)
+            return session.exec(statement).one()
+
+    def summarize_rate_limit_entries_since(self, since: datetime) -> tuple[int, datetime | None]:
+        """Count rate limit entries since a given time and find the newest, in one query.
+
+        Args:
+            since: Datetime to search from.
+
+        Returns:
+            Tuple of (number of entries, newest entry's timestamp or None).
+        """
+        with self.get_session() as session:
+            statement = select(func.count(), func.max(RateLimitEntry.timestamp)).where(
+                RateLimitEntry.timestamp >= since
+            )
+            count, latest = session.exec(statement).one()
+            return count, latest
+
+    def get_latest_rate_limit_timestamp(self, since: datetime) -> datetime | None:
+        """Get the timestamp of the newest rate limit entry since a given time.
+
+        Args:
+            since: Datetime to search from.
+
+        Returns:
+            The newest entry's timestamp, or None if there are no entries.
+        """
+        with self.get_session() as session:
+            statement = select(func.max(RateLimitEntry.timestamp)).where(
+                RateLimitEntry.timestamp >= since
+            )
+            return session.exec(statement).one()
@@ -25,29 +25,15 @@ def get_database_stats(db_service: DatabaseService) -> dict[str, Any]:
             - degree_distribution: Dict mapping degree (1, 2, 3) to count
     """
     with db_service.get_session() as session:
-        # Total connections
-        total_stmt = select(func.count()).select_from(ConnectionProfile)
-        total_connections = session.exec(total_stmt).one()
-
-        # Unique companies (non-null)
-        companies_stmt = select(func.count(func.distinct(ConnectionProfile.current_company))).where(
-            ConnectionProfile.current_company.is_not(None)  # type: ignore[union-attr]
-        )
-        unique_companies = session.exec(companies_stmt).one()
-
-        # Unique locations (non-null)
-        locations_stmt = select(func.count(func.distinct(ConnectionProfile.location))).where(
-            ConnectionProfile.location.is_not(None)  # type: ignore[union-attr]
-        )
-        unique_locations = session.exec(locations_stmt).one()
-
-        # Unique search queries (non-null)
-        queries_stmt = select(func.count(func.distinct(ConnectionProfile.search_query))).where(
-            ConnectionProfile.search_query.is_not(None)  # type: ignore[union-attr]
-        )
-        recent_searches_count = session.exec(queries_stmt).one()
-
-        # List of search queries
+        # Totals in one scan; COUNT(DISTINCT ...) already skips NULLs
+        totals_stmt = select(
+            func.count(),
+            func.count(func.distinct(ConnectionProfile.current_company)),
+            func.count(func.distinct(ConnectionProfile.location)),
+        ).select_from(ConnectionProfile)
+        total_connections, unique_companies, unique_locations = session.exec(totals_stmt).one()
+
+        # Distinct search queries; their count is the length of this list
         queries_list_stmt = (
             select(ConnectionProfile.search_query)
             .where(
@@ -56,6 +42,7 @@ def get_database_stats(db_service: DatabaseService) -> dict[str, Any]:
             .distinct()
         )
         search_queries = list(session.exec(queries_list_stmt).all())
+        recent_searches_count = len(search_queries)
 
         # Degree distribution
         degree_stmt = select(ConnectionProfile.connection_degree, func.count()).group_by(
@@ -1,13 +1,27 @@
 # ABOUTME: Display module for Rich terminal output formatting.
-# ABOUTME: Exports ConnectionTable for rendering connection profiles in tables.
+# ABOUTME: Exports ConnectionTable and error panels, loading each submodule on first use.
 
-from linkedin_scraper.display.errors import (
-    display_cookie_help,
-    display_error,
-    display_network_error,
-    display_rate_limit_exceeded,
-)
-from linkedin_scraper.display.tables import ConnectionTable
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from linkedin_scraper.display.errors import (
+        display_cookie_help,
+        display_error,
+        display_network_error,
+        display_rate_limit_exceeded,
+    )
+    from linkedin_scraper.display.tables import ConnectionTable
+
+# Public name -> defining submodule. Importing the package stays cheap, and the
+# search path that only needs the table never loads the error helpers.
+_EXPORTS = {
+    "ConnectionTable": "linkedin_scraper.display.tables",
+    "display_cookie_help": "linkedin_scraper.display.errors",
+    "display_error": "linkedin_scraper.display.errors",
+    "display_network_error": "linkedin_scraper.display.errors",
+    "display_rate_limit_exceeded": "linkedin_scraper.display.errors",
+}
 
 __all__ = [
     "ConnectionTable",
@@ -16,3 +30,23 @@ __all__ = [
     "display_network_error",
     "display_rate_limit_exceeded",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name from its submodule on first access.
+
+    Args:
+        name: Attribute being looked up on the package.
+
+    Returns:
+        The exported class or function.
+
+    Raises:
+        AttributeError: For names the package does not export.
+    """
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
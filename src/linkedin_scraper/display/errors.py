@@ -1,12 +1,30 @@
 # ABOUTME: Error display helpers for formatting error messages with Rich.
 # ABOUTME: Provides user-friendly error panels for auth failures, rate limits, and generic errors.
 
-import traceback
 from datetime import datetime
+from functools import cache
 
 from rich.panel import Panel
 from rich.text import Text
 
+# Static message bodies, built once. Rendering never mutates a Text, so every
+# panel can share these instances.
+_RATE_LIMIT_MESSAGE = Text.assemble(
+    ("Daily rate limit reached!\n\n", "bold red"),
+    ("You have exceeded the maximum number of searches allowed for today.\n", "yellow"),
+    ("The limit will reset at ", "dim"),
+    ("midnight UTC", "bold cyan"),
+    (".\n\n", "dim"),
+    ("Please try again tomorrow.", "dim"),
+)
+
+_NETWORK_SUGGESTIONS = Text.assemble(
+    ("Suggestions:\n", "bold"),
+    ("• Check your internet connection\n", "dim"),
+    ("• Try again in a few moments\n", "dim"),
+    ("• LinkedIn may be temporarily unavailable", "dim"),
+)
+
 
 def display_error(error: Exception, verbose: bool = False) -> Panel:
     """Format an error as a Rich Panel.
@@ -26,6 +44,8 @@ def display_error(error: Exception, verbose: bool = False) -> Panel:
     content.append(error_message, style="red")
 
     if verbose:
+        import traceback
+
         content.append("\n\n")
         content.append("Traceback:", style="dim")
         content.append("\n")
@@ -40,9 +60,12 @@ def display_error(error: Exception, verbose: bool = False) -> Panel:
     )
 
 
+@cache
 def display_cookie_help() -> Panel:
     """Display help information for obtaining the LinkedIn li_at cookie.
 
+    The content is static, so the markup is parsed and the panel built once.
+
     Returns:
         A Rich Panel containing step-by-step instructions for getting
         the LinkedIn session cookie from a browser.
@@ -78,19 +101,8 @@ def display_rate_limit_exceeded(reset_time: datetime) -> Panel:
     Returns:
         A Rich Panel showing when the user can try again.
     """
-    message = Text()
-    message.append("Daily rate limit reached!\n\n", style="bold red")
-    message.append(
-        "You have exceeded the maximum number of searches allowed for today.\n",
-        style="yellow",
-    )
-    message.append("The limit will reset at ", style="dim")
-    message.append("midnight UTC", style="bold cyan")
-    message.append(".\n\n", style="dim")
-    message.append("Please try again tomorrow.", style="dim")
-
     return Panel(
-        message,
+        _RATE_LIMIT_MESSAGE,
         title="Rate Limit Exceeded",
         border_style="yellow",
         padding=(1, 2),
@@ -106,13 +118,11 @@ def display_network_error(error: Exception) -> Panel:
     Returns:
         A Rich Panel with retry suggestions.
     """
-    message = Text()
-    message.append("Network Error\n\n", style="bold red")
-    message.append(f"{error}\n\n", style="red")
-    message.append("Suggestions:\n", style="bold")
-    message.append("• Check your internet connection\n", style="dim")
-    message.append("• Try again in a few moments\n", style="dim")
-    message.append("• LinkedIn may be temporarily unavailable", style="dim")
+    message = Text.assemble(
+        ("Network Error\n\n", "bold red"),
+        (f"{error}\n\n", "red"),
+        _NETWORK_SUGGESTIONS,
+    )
 
     return Panel(
         message,
@@ -23,11 +23,11 @@ def display_search_summary(
         Rich Panel containing the search summary.
     """
     if count == 0:
-        result_text = "[yellow]No results found[/yellow]"
+        result_text, result_style = "No results found", "yellow"
     elif count == 1:
-        result_text = "[green]1 result found[/green]"
+        result_text, result_style = "1 result found", "green"
     else:
-        result_text = f"[green]{count} results found[/green]"
+        result_text, result_style = f"{count} results found", "green"
 
     duration_formatted = f"{duration_seconds:.2f}s"
 
@@ -35,7 +35,7 @@ def display_search_summary(
     content.append("Query: ", style="dim")
     content.append(f"{query}\n", style="cyan")
     content.append("Results: ", style="dim")
-    content.append_text(Text.from_markup(result_text))
+    content.append(result_text, style=result_style)
     content.append("\n")
     content.append("Duration: ", style="dim")
     content.append(duration_formatted, style="blue")
@@ -60,30 +60,25 @@ def display_rate_limit_warning(remaining: int) -> Panel | None:
     if remaining >= WARNING_THRESHOLD:
         return None
 
+    # Styled spans are built directly; no markup string to parse per call
     if remaining == 0:
-        message = (
-            "[bold red]Daily rate limit reached![/bold red]\n"
-            "You cannot perform more searches until tomorrow (midnight UTC)."
+        message = Text.assemble(
+            ("Daily rate limit reached!", "bold red"),
+            "\nYou cannot perform more searches until tomorrow (midnight UTC).",
         )
         title = "Rate Limit Reached"
         border_style = "red"
-    elif remaining == 1:
-        message = (
-            f"[yellow]Only {remaining} search remaining for today.[/yellow]\n"
-            "Consider waiting until tomorrow to continue."
-        )
-        title = "Rate Limit Warning"
-        border_style = "yellow"
     else:
-        message = (
-            f"[yellow]Only {remaining} searches remaining for today.[/yellow]\n"
-            "Consider waiting until tomorrow to continue."
+        noun = "search" if remaining == 1 else "searches"
+        message = Text.assemble(
+            (f"Only {remaining} {noun} remaining for today.", "yellow"),
+            "\nConsider waiting until tomorrow to continue.",
         )
         title = "Rate Limit Warning"
         border_style = "yellow"
 
     return Panel(
-        Text.from_markup(message),
+        message,
         title=title,
         border_style=border_style,
         padding=(1, 2),
@@ -1,7 +1,10 @@
 # ABOUTME: Rich table rendering for connection profiles.
 # ABOUTME: Provides ConnectionTable class for displaying search results in formatted tables.
 
+from collections.abc import Iterable, Iterator
+
 from rich.table import Table
+from rich.text import Text
 
 from linkedin_scraper.models import ConnectionProfile
 
@@ -23,47 +26,80 @@ class ConnectionTable:
         3: "red",
     }
 
+    # Pre-styled degree cells, built once so rows need no markup formatting or parsing.
+    # Rendering never mutates a Text, so every row can share these instances.
+    DEGREE_CELLS: dict[int, Text] = {
+        degree: Text(str(degree), style=color) for degree, color in DEGREE_COLORS.items()
+    }
+
     def __init__(self) -> None:
         """Initialize the ConnectionTable renderer."""
         pass
 
-    def _truncate(self, text: str | None, max_length: int) -> str:
-        """Truncate text to max length with ellipsis.
+    def _get_degree_styled(self, degree: int) -> Text:
+        """Get the connection degree with color styling.
 
         Args:
-            text: The text to truncate, or None.
-            max_length: Maximum length before truncation.
+            degree: The connection degree (1, 2, or 3).
 
         Returns:
-            Truncated text with ellipsis, or empty string if None.
+            Rich Text styled with the degree's color, white for unknown degrees.
         """
-        if text is None:
-            return ""
-        if len(text) <= max_length:
-            return text
-        return text[: max_length - 3] + "..."
-
-    def _get_degree_styled(self, degree: int) -> str:
-        """Get the connection degree with color styling.
+        cell = self.DEGREE_CELLS.get(degree)
+        if cell is None:
+            return Text(str(degree), style="white")
+        return cell
+
+    def _profiles_to_rows(
+        self, profiles: Iterable[ConnectionProfile]
+    ) -> Iterator[tuple[str, str, str, str, str, Text]]:
+        """Convert profiles to table rows.
+
+        Kept separate from render() so the per-profile string work runs in one
+        tight loop without building Rich objects; degree cells are the shared,
+        pre-styled Text instances. Long values are cut to their column's maximum
+        length with a trailing ellipsis. Rows are yielded lazily so no
+        intermediate list of rows is held alongside the profiles.
 
         Args:
-            degree: The connection degree (1, 2, or 3).
+            profiles: ConnectionProfile objects to convert.
 
-        Returns:
-            Rich-formatted string with appropriate color.
+        Yields:
+            (row number, name, headline, company, location, degree) tuples.
         """
-        color = self.DEGREE_COLORS.get(degree, "white")
-        return f"[{color}]{degree}[/{color}]"
+        get_degree_styled = self._get_degree_styled
+        max_headline = self.MAX_HEADLINE_LENGTH
+        max_company = self.MAX_COMPANY_LENGTH
+        max_location = self.MAX_LOCATION_LENGTH
+        for idx, profile in enumerate(profiles, 1):
+            headline = profile.headline or ""
+            if len(headline) > max_headline:
+                headline = headline[: max_headline - 3] + "..."
+            company = profile.current_company or ""
+            if len(company) > max_company:
+                company = company[: max_company - 3] + "..."
+            location = profile.location or ""
+            if len(location) > max_location:
+                location = location[: max_location - 3] + "..."
+            yield (
+                str(idx),
+                f"{profile.first_name} {profile.last_name}",
+                headline,
+                company,
+                location,
+                get_degree_styled(profile.connection_degree),
+            )
 
     def render(
         self,
-        profiles: list[ConnectionProfile],
+        profiles: Iterable[ConnectionProfile],
         title: str | None = None,
     ) -> Table:
         """Render connection profiles as a Rich Table.
 
         Args:
-            profiles: List of ConnectionProfile objects to display.
+            profiles: ConnectionProfile objects to display. Iterated once, so a
+                generator works as well as a list.
             title: Optional title for the table.
 
         Returns:
@@ -78,20 +114,7 @@ class ConnectionTable:
         table.add_column("Location", style="green", max_width=self.MAX_LOCATION_LENGTH)
         table.add_column("Degree", style="yellow", width=6)
 
-        for idx, profile in enumerate(profiles, 1):
-            name = f"{profile.first_name} {profile.last_name}"
-            headline = self._truncate(profile.headline, self.MAX_HEADLINE_LENGTH)
-            company = self._truncate(profile.current_company, self.MAX_COMPANY_LENGTH)
-            location = self._truncate(profile.location, self.MAX_LOCATION_LENGTH)
-            degree_styled = self._get_degree_styled(profile.connection_degree)
-
-            table.add_row(
-                str(idx),
-                name,
-                headline,
-                company,
-                location,
-                degree_styled,
-            )
+        for row in self._profiles_to_rows(profiles):
+            table.add_row(*row)
 
         return table
@@ -2,6 +2,7 @@
 # ABOUTME: Exports profiles to CSV format with metadata header and proper escaping.
 
 import csv
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -25,36 +26,51 @@ class CSVExporter:
         "found_at",
     ]
 
+    # Large exports are thousands of short rows; a 1 MiB buffer turns them into
+    # a handful of write syscalls instead of one per 8 KiB default buffer.
+    WRITE_BUFFER_SIZE = 1 << 20
+
     def export(
         self,
-        profiles: list[ConnectionProfile],
+        profiles: Iterable[ConnectionProfile],
         output_path: Path,
         query_info: str | None = None,
+        record_count: int | None = None,
     ) -> Path:
         """Export connection profiles to a CSV file.
 
+        Profiles are written as they are consumed, so a lazily-fetched iterator
+        can be exported without holding every profile in memory.
+
         Args:
-            profiles: List of ConnectionProfile objects to export.
+            profiles: ConnectionProfile objects to export.
             output_path: Path to the output CSV file.
             query_info: Optional query string to include in metadata.
+            record_count: Number of profiles, for the metadata row. Must match
+                what profiles yields, e.g. a count read in the same transaction.
+                If None, profiles are materialized to count them.
 
         Returns:
             Path to the created CSV file.
         """
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
+        if record_count is None:
+            profiles = list(profiles)
+            record_count = len(profiles)
+
+        with open(
+            output_path, "w", newline="", encoding="utf-8", buffering=self.WRITE_BUFFER_SIZE
+        ) as f:
             writer = csv.writer(f)
 
             # Write metadata row
-            metadata = self._create_metadata_row(len(profiles), query_info)
+            metadata = self._create_metadata_row(record_count, query_info)
             writer.writerow(metadata)
 
             # Write headers
             writer.writerow(self.HEADERS)
 
-            # Write profile data
-            for profile in profiles:
-                row = self._profile_to_row(profile)
-                writer.writerow(row)
+            # Write profile data; writerows drives the loop in C
+            writer.writerows(map(self._profile_to_row, profiles))
 
         return output_path
 
@@ -97,5 +113,24 @@ class CSVExporter:
             profile.profile_url,
             str(profile.connection_degree),
             profile.search_query or "",
-            profile.found_at.strftime("%Y-%m-%d %H:%M:%S") if profile.found_at else "",
+            self._format_timestamp(profile.found_at),
         ]
+
+    @staticmethod
+    def _format_timestamp(value: datetime | None) -> str:
+        """Format a timestamp as YYYY-MM-DD HH:MM:SS.
+
+        isoformat is several times faster than strftime and gives the same text
+        once any timezone is dropped.
+
+        Args:
+            value: The datetime to format, or None.
+
+        Returns:
+            The formatted timestamp, or an empty string if value is None.
+        """
+        if value is None:
+            return ""
+        if value.tzinfo is not None:
+            value = value.replace(tzinfo=None)
+        return value.isoformat(" ", "seconds")
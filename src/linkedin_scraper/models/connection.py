@@ -15,8 +15,9 @@ class ConnectionProfile(SQLModel, table=True):
     model_config = {"validate_assignment": True}
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    linkedin_urn_id: Annotated[str, Field(index=True, description="LinkedIn URN ID")]
-    public_id: Annotated[str, Field(index=True, description="URL-friendly identifier")]
+    # SQLModel only reads index=True from an assigned Field, not from Annotated metadata
+    linkedin_urn_id: str = Field(index=True, description="LinkedIn URN ID")
+    public_id: str = Field(index=True, description="URL-friendly identifier")
 
     first_name: str
     last_name: str
@@ -29,9 +30,9 @@ class ConnectionProfile(SQLModel, table=True):
     profile_url: str
     connection_degree: Annotated[int, Field(ge=1, le=3, description="1st, 2nd, or 3rd degree")]
 
-    search_query: Annotated[
-        str | None, Field(default=None, description="The search query that found this profile")
-    ]
+    search_query: str | None = Field(
+        default=None, index=True, description="The search query that found this profile"
+    )
     found_at: datetime = Field(default_factory=datetime.utcnow)
 
     @property
@@ -4,6 +4,7 @@
 from datetime import datetime
 from enum import Enum
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -18,6 +19,10 @@ class RateLimitEntry(SQLModel, table=True):
     """Tracks API calls for rate limiting."""
 
     __tablename__ = "rate_limit_entries"
+    # Serves the "entries since <time>" lookups, with or without an action type filter
+    __table_args__ = (
+        Index("ix_rate_limit_entries_timestamp_action_type", "timestamp", "action_type"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     action_type: ActionType
@@ -71,11 +71,10 @@ class RateLimiter:
             Number of actions performed today.
         """
         today_start = self._get_today_start()
-        entries = self._db_service.get_rate_limit_entries_since(
+        return self._db_service.count_rate_limit_entries_since(
             since=today_start,
             action_type=action_type,
         )
-        return len(entries)
 
     def get_remaining_actions(self) -> int:
         """Get the number of remaining actions allowed today.
@@ -94,12 +93,7 @@ class RateLimiter:
             Datetime of the last action, or None if no actions have been recorded.
         """
         today_start = self._get_today_start()
-        entries = self._db_service.get_rate_limit_entries_since(since=today_start)
-
-        if not entries:
-            return None
-
-        return max(entry.timestamp for entry in entries)
+        return self._db_service.get_latest_rate_limit_timestamp(since=today_start)
 
     def seconds_until_next_allowed(self) -> int:
         """Calculate seconds to wait before the next action is allowed.
@@ -109,8 +103,17 @@ class RateLimiter:
         Returns:
             Number of seconds to wait, or 0 if no waiting is needed.
         """
-        last_action_time = self.get_last_action_time()
+        return self._seconds_to_wait_after(self.get_last_action_time())
+
+    def _seconds_to_wait_after(self, last_action_time: datetime | None) -> int:
+        """Calculate seconds to wait given the time of the last action.
+
+        Args:
+            last_action_time: Datetime of the last action, or None if there is none.
 
+        Returns:
+            Number of seconds to wait, or 0 if no waiting is needed.
+        """
         if last_action_time is None:
             return 0
 
@@ -143,7 +146,15 @@ class RateLimiter:
         If no actions have been recorded, returns immediately.
         Otherwise, waits until min_delay_seconds have passed since the last action.
         """
-        seconds_to_wait = self.seconds_until_next_allowed()
+        self._sleep_for(self.seconds_until_next_allowed())
+
+    @staticmethod
+    def _sleep_for(seconds_to_wait: int) -> None:
+        """Sleep for the given number of seconds, if any.
+
+        Args:
+            seconds_to_wait: Seconds to sleep; zero means return immediately.
+        """
         if seconds_to_wait > 0:
             time.sleep(seconds_to_wait)
 
@@ -156,6 +167,35 @@ class RateLimiter:
         today_start = self._get_today_start()
         return today_start + timedelta(days=1)
 
+    def ensure_can_perform(self) -> None:
+        """Raise if the daily limit is already reached, without waiting or recording.
+
+        Lets callers fail fast before doing expensive setup such as loading
+        credentials or calling LinkedIn. The limit covers all action types,
+        as in check_and_wait.
+
+        Raises:
+            RateLimitExceeded: If the daily action limit has been reached.
+        """
+        self._ensure_under_limit(self.get_actions_today())
+
+    def _ensure_under_limit(self, actions_today: int) -> None:
+        """Raise if the given count of today's actions has reached the daily limit.
+
+        Args:
+            actions_today: Number of actions performed today.
+
+        Raises:
+            RateLimitExceeded: If the daily action limit has been reached.
+        """
+        if actions_today >= self._settings.max_actions_per_day:
+            reset_time = self._get_tomorrow_start()
+            raise RateLimitExceeded(
+                f"Daily limit of {self._settings.max_actions_per_day} actions reached. "
+                f"Try again after {reset_time.isoformat()}",
+                reset_time=reset_time,
+            )
+
     def check_and_wait(self, action_type: ActionType) -> None:
         """Check rate limit, wait if needed, and record the action.
 
@@ -171,13 +211,10 @@ class RateLimiter:
         Raises:
             RateLimitExceeded: If the daily action limit has been reached.
         """
-        if not self.can_perform_action(action_type):
-            reset_time = self._get_tomorrow_start()
-            raise RateLimitExceeded(
-                f"Daily limit of {self._settings.max_actions_per_day} actions reached. "
-                f"Try again after {reset_time.isoformat()}",
-                reset_time=reset_time,
-            )
-
-        self.wait_if_needed()
+        # One query supplies both the day's count and the last action time
+        actions_today, last_action_time = self._db_service.summarize_rate_limit_entries_since(
+            since=self._get_today_start()
+        )
+        self._ensure_under_limit(actions_today)
+        self._sleep_for(self._seconds_to_wait_after(last_action_time))
         self.record_action(action_type)
@@ -58,6 +58,9 @@ class SearchOrchestrator:
             RateLimitExceeded: If the daily rate limit has been reached.
             LinkedInRateLimitError: If LinkedIn's rate limit is triggered.
         """
+        # Fail fast on an exhausted daily limit before touching keyring or LinkedIn
+        self._rate_limiter.ensure_can_perform()
+
         # Load cookies for the account
         cookies = self._cookie_manager.get_cookies(account)
         if cookies is None:
@@ -79,9 +82,8 @@ class SearchOrchestrator:
             for result in raw_results
         ]
 
-        # Save results to database
-        for profile in profiles:
-            self._db_service.save_connection(profile)
+        # Save results to database in batched transactions
+        self._db_service.save_connections(profiles)
 
         return profiles
 
@@ -115,6 +117,9 @@ class SearchOrchestrator:
             RateLimitExceeded: If the daily rate limit has been reached.
             LinkedInRateLimitError: If LinkedIn's rate limit is triggered.
         """
+        # Fail fast on an exhausted daily limit before touching keyring or LinkedIn
+        self._rate_limiter.ensure_can_perform()
+
         # Load cookies for the account
         cookies = self._cookie_manager.get_cookies(account)
         if cookies is None:
@@ -157,9 +162,8 @@ class SearchOrchestrator:
             map_search_result_to_profile(result, search_query=keywords) for result in raw_results
         ]
 
-        # Save results to database
-        for profile in profiles:
-            self._db_service.save_connection(profile)
+        # Save results to database in batched transactions
+        self._db_service.save_connections(profiles)
 
         return profiles
 
@@ -4,6 +4,15 @@
 import pytest
 from sqlmodel import Session, SQLModel, create_engine
 
+from linkedin_scraper.database.service import dispose_engines
+
+
+@pytest.fixture(autouse=True)
+def _dispose_shared_engines():
+    """Release the shared DatabaseService engines after each test."""
+    yield
+    dispose_engines()
+
 
 @pytest.fixture
 def test_engine():
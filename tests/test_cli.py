@@ -1,8 +1,14 @@
 # ABOUTME: Tests for the CLI skeleton using Typer.
 # ABOUTME: Covers command stubs, ToS acceptance flow, and basic CLI structure.
 
+import io
+import json
 import os
+import subprocess
+import sys
 import tempfile
+import threading
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest import mock
@@ -10,11 +16,24 @@ from unittest import mock
 import pytest
 from typer.testing import CliRunner
 
-from linkedin_scraper.cli import app, get_cookie_instructions
+from linkedin_scraper.cli import (
+    _check_tos_acceptance,
+    _cookie_instructions_panel,
+    _generate_default_export_path,
+    _get_console,
+    _get_db_service,
+    _parse_degrees,
+    _render_accounts_panel,
+    _render_database_stats_panel,
+    _tos_panel,
+    app,
+    get_cookie_instructions,
+)
 from linkedin_scraper.config import get_settings
 from linkedin_scraper.linkedin.exceptions import LinkedInAuthError, LinkedInRateLimitError
 from linkedin_scraper.models import ConnectionProfile
 from linkedin_scraper.rate_limit.exceptions import RateLimitExceeded
+from linkedin_scraper.search.filters import NetworkDepth
 
 
 @pytest.fixture
@@ -36,8 +55,10 @@ def temp_settings_env():
         }
         with mock.patch.dict(os.environ, env_vars, clear=False):
             get_settings.cache_clear()
+            _get_db_service.cache_clear()
             yield tmpdir
         get_settings.cache_clear()
+        _get_db_service.cache_clear()
 
 
 @pytest.fixture
@@ -53,8 +74,10 @@ def temp_settings_env_tos_not_accepted():
         }
         with mock.patch.dict(os.environ, env_vars, clear=False):
             get_settings.cache_clear()
+            _get_db_service.cache_clear()
             yield tmpdir
         get_settings.cache_clear()
+        _get_db_service.cache_clear()
 
 
 class TestCLIBasics:
@@ -106,6 +129,19 @@ class TestCLIBasics:
         assert result.exit_code == 0
         assert "status" in result.output.lower()
 
+    def test_importing_cli_defers_service_modules(self) -> None:
+        """Test that importing the CLI does not load settings, database, API or metadata modules."""
+        code = (
+            "import sys, linkedin_scraper.cli; "
+            "heavy = ['pydantic_settings', 'sqlmodel', 'linkedin_api', 'keyring', "
+            "'importlib.metadata']; "
+            "print(','.join(m for m in heavy if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
 
 class TestLoginCommand:
     """Tests for the login command."""
@@ -119,7 +155,7 @@ class TestLoginCommand:
 
     def test_login_prompts_for_cookie(self, runner: CliRunner, temp_settings_env: str) -> None:
         """Test that login command prompts for cookie input."""
-        with mock.patch("linkedin_scraper.cli.CookieManager") as mock_cm:
+        with mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm:
             mock_cm.return_value.validate_cookie_format.return_value = False
             result = runner.invoke(app, ["login", "--no-validate"], input="short\n")
             # Should prompt for cookie
@@ -127,7 +163,7 @@ class TestLoginCommand:
 
     def test_login_validates_cookie_format(self, runner: CliRunner, temp_settings_env: str) -> None:
         """Test that login rejects invalid cookie format."""
-        with mock.patch("linkedin_scraper.cli.CookieManager") as mock_cm:
+        with mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm:
             mock_cm.return_value.validate_cookie_format.return_value = False
             result = runner.invoke(app, ["login", "--no-validate"], input="bad\n")
             # Should show error about invalid format
@@ -139,7 +175,7 @@ class TestLoginCommand:
         """Test that login stores cookies on success."""
         valid_li_at = "AQEDAQEBAAAAAAAAAAAAAAFZXyYZWFhW"
         valid_jsessionid = "ajax:1234567890123456789"
-        with mock.patch("linkedin_scraper.cli.CookieManager") as mock_cm:
+        with mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm:
             mock_cm.return_value.validate_cookie_format.return_value = True
             result = runner.invoke(
                 app, ["login", "--no-validate"], input=f"{valid_li_at}\n{valid_jsessionid}\n"
@@ -157,7 +193,7 @@ class TestLoginCommand:
         """Test that login respects --account option."""
         valid_li_at = "AQEDAQEBAAAAAAAAAAAAAAFZXyYZWFhW"
         valid_jsessionid = "ajax:1234567890123456789"
-        with mock.patch("linkedin_scraper.cli.CookieManager") as mock_cm:
+        with mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm:
             mock_cm.return_value.validate_cookie_format.return_value = True
             runner.invoke(
                 app,
@@ -176,8 +212,8 @@ class TestLoginCommand:
         valid_li_at = "AQEDAQEBAAAAAAAAAAAAAAFZXyYZWFhW"
         valid_jsessionid = "ajax:1234567890123456789"
         with (
-            mock.patch("linkedin_scraper.cli.CookieManager") as mock_cm,
-            mock.patch("linkedin_scraper.cli.LinkedInClient") as mock_li,
+            mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm,
+            mock.patch("linkedin_scraper.linkedin.client.LinkedInClient") as mock_li,
         ):
             mock_cm.return_value.validate_cookie_format.return_value = True
             mock_li.return_value.validate_session.return_value = True
@@ -193,8 +229,8 @@ class TestLoginCommand:
         valid_li_at = "AQEDAQEBAAAAAAAAAAAAAAFZXyYZWFhW"
         valid_jsessionid = "ajax:1234567890123456789"
         with (
-            mock.patch("linkedin_scraper.cli.CookieManager") as mock_cm,
-            mock.patch("linkedin_scraper.cli.LinkedInClient") as mock_li,
+            mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm,
+            mock.patch("linkedin_scraper.linkedin.client.LinkedInClient") as mock_li,
         ):
             mock_cm.return_value.validate_cookie_format.return_value = True
             runner.invoke(
@@ -212,8 +248,8 @@ class TestLoginCommand:
         invalid_li_at = "AQEDAQEBAAAAAAAAAAAAAAFZXyYZWFhW"
         invalid_jsessionid = "ajax:1234567890123456789"
         with (
-            mock.patch("linkedin_scraper.cli.CookieManager") as mock_cm,
-            mock.patch("linkedin_scraper.cli.LinkedInClient") as mock_li,
+            mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm,
+            mock.patch("linkedin_scraper.linkedin.client.LinkedInClient") as mock_li,
         ):
             mock_cm.return_value.validate_cookie_format.return_value = True
             mock_li.return_value.validate_session.return_value = False
@@ -232,8 +268,8 @@ class TestLoginCommand:
         invalid_li_at = "AQEDAQEBAAAAAAAAAAAAAAFZXyYZWFhW"
         invalid_jsessionid = "ajax:1234567890123456789"
         with (
-            mock.patch("linkedin_scraper.cli.CookieManager") as mock_cm,
-            mock.patch("linkedin_scraper.cli.LinkedInClient") as mock_li,
+            mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm,
+            mock.patch("linkedin_scraper.linkedin.client.LinkedInClient") as mock_li,
         ):
             mock_cm.return_value.validate_cookie_format.return_value = True
             mock_li.side_effect = LinkedInAuthError("Auth failed")
@@ -265,6 +301,17 @@ class TestGetCookieInstructions:
         instructions = get_cookie_instructions()
         assert "linkedin" in instructions.lower()
 
+    def test_instruction_panels_share_parsed_text(self) -> None:
+        """Test that every instructions panel reuses one pre-parsed Text."""
+        from rich.text import Text
+
+        cyan = _cookie_instructions_panel("Cookie Instructions", "cyan")
+        yellow = _cookie_instructions_panel("How to Get Fresh Cookies", "yellow")
+
+        assert isinstance(cyan.renderable, Text)
+        assert cyan.renderable is yellow.renderable
+        assert _cookie_instructions_panel("Cookie Instructions", "cyan") is cyan
+
 
 class TestSearchCommand:
     """Tests for the search command."""
@@ -304,16 +351,76 @@ class TestSearchCommand:
                 found_at=datetime.now(UTC),
             ),
         ]
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.return_value = sample_profiles
             mock_orch.return_value.get_remaining_actions.return_value = 24
             result = runner.invoke(app, ["search", "-k", "engineer"])
             # Should display results
             assert "john" in result.output.lower() or "doe" in result.output.lower()
 
+    def test_search_prints_results_block_once(
+        self, runner: CliRunner, temp_settings_env: str
+    ) -> None:
+        """Test that the results table, count and quota lines are emitted in one print."""
+        from rich.console import Group
+        from rich.table import Table
+
+        sample_profiles = [
+            ConnectionProfile(
+                linkedin_urn_id="urn:li:member:123",
+                public_id="john-doe",
+                first_name="John",
+                last_name="Doe",
+                profile_url="https://linkedin.com/in/john-doe",
+                connection_degree=1,
+                found_at=datetime.now(UTC),
+            ),
+        ]
+        with (
+            mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch,
+            mock.patch("linkedin_scraper.cli._get_console") as mock_console,
+        ):
+            mock_orch.return_value.execute_search_with_company_name.return_value = sample_profiles
+            mock_orch.return_value.get_remaining_actions.return_value = 24
+            result = runner.invoke(app, ["search", "-k", "engineer"])
+
+        assert result.exit_code == 0
+        groups = [
+            call.args[0]
+            for call in mock_console.return_value.print.call_args_list
+            if call.args and isinstance(call.args[0], Group)
+        ]
+        assert len(groups) == 1
+        renderables = groups[0].renderables
+        assert isinstance(renderables[0], Table)
+        assert "Found 1 result(s)" in renderables[2]
+        assert "Remaining searches today" in renderables[-1]
+
+    def test_search_shows_spinner_while_searching(
+        self, runner: CliRunner, temp_settings_env: str
+    ) -> None:
+        """Test that the search call runs inside a console status spinner."""
+        events: list[str] = []
+        with (
+            mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch,
+            mock.patch("linkedin_scraper.cli._get_console") as mock_console,
+        ):
+            spinner = mock_console.return_value.status.return_value
+            spinner.__enter__.side_effect = lambda *_: events.append("enter")
+            spinner.__exit__.side_effect = lambda *_: events.append("exit")
+            mock_orch.return_value.execute_search_with_company_name.side_effect = (
+                lambda **_: events.append("search") or []
+            )
+            mock_orch.return_value.get_remaining_actions.return_value = 25
+            result = runner.invoke(app, ["search", "-k", "engineer"])
+
+        assert result.exit_code == 0
+        assert events == ["enter", "search", "exit"]
+        assert mock_console.return_value.status.call_args.kwargs["spinner"] == "dots"
+
     def test_search_uses_default_account(self, runner: CliRunner, temp_settings_env: str) -> None:
         """Test that search uses 'default' account when not specified."""
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.return_value = []
             mock_orch.return_value.get_remaining_actions.return_value = 25
             runner.invoke(app, ["search", "-k", "engineer"])
@@ -322,7 +429,7 @@ class TestSearchCommand:
 
     def test_search_with_custom_account(self, runner: CliRunner, temp_settings_env: str) -> None:
         """Test that search respects --account option."""
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.return_value = []
             mock_orch.return_value.get_remaining_actions.return_value = 25
             runner.invoke(app, ["search", "-k", "engineer", "-a", "work"])
@@ -331,7 +438,7 @@ class TestSearchCommand:
 
     def test_search_with_company_filter(self, runner: CliRunner, temp_settings_env: str) -> None:
         """Test that search passes company name to orchestrator."""
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.return_value = []
             mock_orch.return_value.get_remaining_actions.return_value = 25
             runner.invoke(app, ["search", "-k", "engineer", "-c", "TechCorp"])
@@ -340,7 +447,7 @@ class TestSearchCommand:
 
     def test_search_with_location_filter(self, runner: CliRunner, temp_settings_env: str) -> None:
         """Test that search passes location to orchestrator."""
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.return_value = []
             mock_orch.return_value.get_remaining_actions.return_value = 25
             runner.invoke(app, ["search", "-k", "engineer", "-l", "San Francisco"])
@@ -349,7 +456,7 @@ class TestSearchCommand:
 
     def test_search_with_degree_filter(self, runner: CliRunner, temp_settings_env: str) -> None:
         """Test that search parses and passes degree filter."""
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.return_value = []
             mock_orch.return_value.get_remaining_actions.return_value = 25
             runner.invoke(app, ["search", "-k", "engineer", "-d", "1,2,3"])
@@ -359,7 +466,7 @@ class TestSearchCommand:
 
     def test_search_with_limit(self, runner: CliRunner, temp_settings_env: str) -> None:
         """Test that search respects --limit option."""
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.return_value = []
             mock_orch.return_value.get_remaining_actions.return_value = 25
             runner.invoke(app, ["search", "-k", "engineer", "--limit", "50"])
@@ -370,7 +477,7 @@ class TestSearchCommand:
         self, runner: CliRunner, temp_settings_env: str
     ) -> None:
         """Test that search shows rate limit status after search."""
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.return_value = []
             mock_orch.return_value.get_remaining_actions.return_value = 20
             result = runner.invoke(app, ["search", "-k", "engineer"])
@@ -379,7 +486,7 @@ class TestSearchCommand:
 
     def test_search_handles_auth_error(self, runner: CliRunner, temp_settings_env: str) -> None:
         """Test that search shows helpful error on auth failure."""
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.side_effect = LinkedInAuthError(
                 "No cookie found"
             )
@@ -388,11 +495,41 @@ class TestSearchCommand:
             assert result.exit_code != 0
             assert "cookie" in result.output.lower() or "login" in result.output.lower()
 
+    def test_search_reports_service_setup_failure(
+        self, runner: CliRunner, temp_settings_env: str
+    ) -> None:
+        """Test that a failure while building search services is handled like a search error."""
+        with mock.patch(
+            "linkedin_scraper.cli._get_db_service", side_effect=OSError("disk is read-only")
+        ):
+            result = runner.invoke(app, ["search", "-k", "engineer"])
+
+        assert result.exit_code == 1
+        assert not isinstance(result.exception, OSError)
+        assert "disk is read-only" in result.output
+        assert "local file could not be read or written" in result.output
+        assert "Network Error" not in result.output
+        assert "internet connection" not in result.output
+
+    def test_search_reports_network_failure_as_network_error(
+        self, runner: CliRunner, temp_settings_env: str
+    ) -> None:
+        """Test that connection failures still get the network error panel."""
+        with mock.patch(
+            "linkedin_scraper.cli._get_db_service",
+            side_effect=ConnectionError("connection reset"),
+        ):
+            result = runner.invoke(app, ["search", "-k", "engineer"])
+
+        assert result.exit_code == 1
+        assert "Network Error" in result.output
+        assert "internet connection" in result.output
+
     def test_search_handles_rate_limit_exceeded(
         self, runner: CliRunner, temp_settings_env: str
     ) -> None:
         """Test that search shows helpful error when rate limit exceeded."""
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.side_effect = RateLimitExceeded(
                 "Daily limit reached", reset_time=datetime.now(UTC)
             )
@@ -405,7 +542,7 @@ class TestSearchCommand:
         self, runner: CliRunner, temp_settings_env: str
     ) -> None:
         """Test that search handles LinkedIn's rate limit error."""
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.side_effect = (
                 LinkedInRateLimitError("Too many requests")
             )
@@ -429,7 +566,7 @@ class TestSearchCommand:
             )
             for i in range(5)
         ]
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.return_value = sample_profiles
             mock_orch.return_value.get_remaining_actions.return_value = 24
             result = runner.invoke(app, ["search", "-k", "engineer"])
@@ -437,6 +574,80 @@ class TestSearchCommand:
             assert "5" in result.output
 
 
+class TestParseDegrees:
+    """Tests for the --degree option parser."""
+
+    def test_parses_single_and_multiple_degrees(self) -> None:
+        """Test that comma-separated degrees map to NetworkDepth values in order."""
+        assert _parse_degrees("1") == (NetworkDepth.FIRST,)
+        assert _parse_degrees("1,2,3") == (
+            NetworkDepth.FIRST,
+            NetworkDepth.SECOND,
+            NetworkDepth.THIRD,
+        )
+        assert _parse_degrees("3,1") == (NetworkDepth.THIRD, NetworkDepth.FIRST)
+
+    def test_ignores_whitespace_around_degrees(self) -> None:
+        """Test that whitespace around each degree is allowed."""
+        assert _parse_degrees(" 1 , 3 ") == (NetworkDepth.FIRST, NetworkDepth.THIRD)
+
+    def test_skips_invalid_tokens(self) -> None:
+        """Test that tokens other than a single 1-3 digit are ignored."""
+        assert _parse_degrees("1,4,12,x,1 2,3") == (NetworkDepth.FIRST, NetworkDepth.THIRD)
+
+    def test_deduplicates_repeated_degrees(self) -> None:
+        """Test that a repeated degree is only returned once."""
+        assert _parse_degrees("2,2,1,2") == (NetworkDepth.SECOND, NetworkDepth.FIRST)
+
+    def test_defaults_to_first_and_second_when_empty(self) -> None:
+        """Test that input without valid degrees falls back to 1st and 2nd."""
+        assert _parse_degrees("") == (NetworkDepth.FIRST, NetworkDepth.SECOND)
+        assert _parse_degrees("9,,") == (NetworkDepth.FIRST, NetworkDepth.SECOND)
+
+    def test_default_degrees_parse_to_first_and_second(self) -> None:
+        """Test that the default --degree value maps to 1st and 2nd degree."""
+        assert _parse_degrees("1,2") == (NetworkDepth.FIRST, NetworkDepth.SECOND)
+
+    def test_results_are_memoized(self) -> None:
+        """Test that repeated inputs return the cached tuple."""
+        _parse_degrees.cache_clear()
+        first = _parse_degrees("1,2")
+        assert _parse_degrees("1,2") is first
+        assert _parse_degrees.cache_info().hits == 1
+
+
+class TestGetConsole:
+    """Tests for the shared CLI console."""
+
+    def test_console_prints_text_verbatim(self) -> None:
+        """Test that the console neither replaces emoji codes nor auto-highlights."""
+        _get_console.cache_clear()
+        try:
+            console = _get_console()
+            with console.capture() as capture:
+                console.print("Rocket :rocket: 42 /tmp/x")
+            assert capture.get().strip() == "Rocket :rocket: 42 /tmp/x"
+
+            segments = list(console.render("value 42"))
+            assert all(segment.style is None for segment in segments if segment.text.strip())
+        finally:
+            _get_console.cache_clear()
+
+
+class TestGetDbService:
+    """Tests for the per-process DatabaseService factory."""
+
+    def test_returns_same_service_for_same_path(self, temp_settings_env: str) -> None:
+        """Test that commands in one process share an initialized DatabaseService."""
+        db_path = Path(temp_settings_env) / "shared.db"
+
+        first = _get_db_service(db_path)
+        second = _get_db_service(db_path)
+
+        assert first is second
+        assert db_path.exists()
+
+
 class TestExportCommand:
     """Tests for the export command."""
 
@@ -465,11 +676,13 @@ class TestExportCommand:
             ),
         ]
         with (
-            mock.patch("linkedin_scraper.cli.DatabaseService") as mock_db,
-            mock.patch("linkedin_scraper.cli.CSVExporter") as mock_exporter,
+            mock.patch("linkedin_scraper.database.service.DatabaseService") as mock_db,
+            mock.patch("linkedin_scraper.export.csv_exporter.CSVExporter") as mock_exporter,
         ):
-            mock_db.return_value.get_connections.return_value = sample_profiles
-            mock_exporter.return_value.export.return_value = Path(temp_settings_env) / "test.csv"
+            mock_db.return_value.read_connections.return_value.__enter__.return_value = (
+                len(sample_profiles),
+                iter(sample_profiles),
+            )
 
             result = runner.invoke(app, ["export", "-o", f"{temp_settings_env}/test.csv"])
 
@@ -493,11 +706,13 @@ class TestExportCommand:
             ),
         ]
         with (
-            mock.patch("linkedin_scraper.cli.DatabaseService") as mock_db,
-            mock.patch("linkedin_scraper.cli.CSVExporter") as mock_exporter,
+            mock.patch("linkedin_scraper.database.service.DatabaseService") as mock_db,
+            mock.patch("linkedin_scraper.export.csv_exporter.CSVExporter") as mock_exporter,
         ):
-            mock_db.return_value.get_connections_by_query.return_value = sample_profiles
-            mock_exporter.return_value.export.return_value = Path(temp_settings_env) / "test.csv"
+            mock_db.return_value.read_connections.return_value.__enter__.return_value = (
+                len(sample_profiles),
+                iter(sample_profiles),
+            )
 
             result = runner.invoke(
                 app,
@@ -505,56 +720,84 @@ class TestExportCommand:
             )
 
             assert result.exit_code == 0
-            # Should call get_connections_by_query with the query
-            mock_db.return_value.get_connections_by_query.assert_called()
+            # Should stream only the rows for the query
+            mock_db.return_value.read_connections.assert_called_once_with(
+                limit=None, query="engineer"
+            )
+            assert mock_exporter.return_value.export.call_args.kwargs["query_info"] == "engineer"
 
     def test_export_with_limit(self, runner: CliRunner, temp_settings_env: str) -> None:
         """Test that export respects --limit option."""
         with (
-            mock.patch("linkedin_scraper.cli.DatabaseService") as mock_db,
-            mock.patch("linkedin_scraper.cli.CSVExporter") as mock_exporter,
+            mock.patch("linkedin_scraper.database.service.DatabaseService") as mock_db,
+            mock.patch("linkedin_scraper.export.csv_exporter.CSVExporter") as mock_exporter,
         ):
-            mock_db.return_value.get_connections.return_value = []
-            mock_exporter.return_value.export.return_value = Path(temp_settings_env) / "test.csv"
+            mock_db.return_value.read_connections.return_value.__enter__.return_value = (
+                50,
+                iter([]),
+            )
 
-            runner.invoke(
+            result = runner.invoke(
                 app,
                 ["export", "--limit", "50", "-o", f"{temp_settings_env}/test.csv"],
             )
 
-            # Should pass limit to get_connections
-            mock_db.return_value.get_connections.assert_called()
-            call_kwargs = mock_db.return_value.get_connections.call_args[1]
+            # Should pass limit to the streamed fetch and hand its count to the exporter
+            mock_db.return_value.read_connections.assert_called()
+            call_kwargs = mock_db.return_value.read_connections.call_args[1]
             assert call_kwargs.get("limit") == 50
+            export_kwargs = mock_exporter.return_value.export.call_args[1]
+            assert export_kwargs.get("record_count") == 50
+            assert "Exported 50 record(s)" in result.output
+
+    def test_export_rejects_negative_limit(self, runner: CliRunner, temp_settings_env: str) -> None:
+        """Test that a negative --limit is refused instead of exporting every row."""
+        with (
+            mock.patch("linkedin_scraper.database.service.DatabaseService") as mock_db,
+            mock.patch("linkedin_scraper.export.csv_exporter.CSVExporter") as mock_exporter,
+        ):
+            result = runner.invoke(
+                app,
+                ["export", "--limit", "-1", "-o", f"{temp_settings_env}/test.csv"],
+            )
+
+            assert result.exit_code == 2
+            mock_db.return_value.read_connections.assert_not_called()
+            mock_exporter.return_value.export.assert_not_called()
 
     def test_export_all_flag_exports_all_connections(
         self, runner: CliRunner, temp_settings_env: str
     ) -> None:
         """Test that --all flag exports all stored connections."""
         with (
-            mock.patch("linkedin_scraper.cli.DatabaseService") as mock_db,
-            mock.patch("linkedin_scraper.cli.CSVExporter") as mock_exporter,
+            mock.patch("linkedin_scraper.database.service.DatabaseService") as mock_db,
+            mock.patch("linkedin_scraper.export.csv_exporter.CSVExporter"),
         ):
-            mock_db.return_value.get_connections.return_value = []
-            mock_exporter.return_value.export.return_value = Path(temp_settings_env) / "test.csv"
+            mock_db.return_value.read_connections.return_value.__enter__.return_value = (
+                0,
+                iter([]),
+            )
 
             runner.invoke(
                 app,
                 ["export", "--all", "-o", f"{temp_settings_env}/test.csv"],
             )
 
-            # Should call get_connections without limit
-            mock_db.return_value.get_connections.assert_called()
+            # Should stream every stored connection instead of a capped fetch
+            mock_db.return_value.read_connections.assert_called_once_with(limit=None, query=None)
+            mock_db.return_value.get_connections.assert_not_called()
 
     def test_export_shows_success_message(self, runner: CliRunner, temp_settings_env: str) -> None:
         """Test that export shows success message with output path."""
         output_path = Path(temp_settings_env) / "export.csv"
         with (
-            mock.patch("linkedin_scraper.cli.DatabaseService") as mock_db,
-            mock.patch("linkedin_scraper.cli.CSVExporter") as mock_exporter,
+            mock.patch("linkedin_scraper.database.service.DatabaseService") as mock_db,
+            mock.patch("linkedin_scraper.export.csv_exporter.CSVExporter"),
         ):
-            mock_db.return_value.get_connections.return_value = []
-            mock_exporter.return_value.export.return_value = output_path
+            mock_db.return_value.read_connections.return_value.__enter__.return_value = (
+                0,
+                iter([]),
+            )
 
             result = runner.invoke(app, ["export", "-o", str(output_path)])
 
@@ -580,11 +823,13 @@ class TestExportCommand:
         ]
         output_path = Path(temp_settings_env) / "export.csv"
         with (
-            mock.patch("linkedin_scraper.cli.DatabaseService") as mock_db,
-            mock.patch("linkedin_scraper.cli.CSVExporter") as mock_exporter,
+            mock.patch("linkedin_scraper.database.service.DatabaseService") as mock_db,
+            mock.patch("linkedin_scraper.export.csv_exporter.CSVExporter"),
         ):
-            mock_db.return_value.get_connections.return_value = sample_profiles
-            mock_exporter.return_value.export.return_value = output_path
+            mock_db.return_value.read_connections.return_value.__enter__.return_value = (
+                len(sample_profiles),
+                iter(sample_profiles),
+            )
 
             result = runner.invoke(app, ["export", "-o", str(output_path)])
 
@@ -597,11 +842,13 @@ class TestExportCommand:
     ) -> None:
         """Test that export uses a default filename when --output is not specified."""
         with (
-            mock.patch("linkedin_scraper.cli.DatabaseService") as mock_db,
-            mock.patch("linkedin_scraper.cli.CSVExporter") as mock_exporter,
+            mock.patch("linkedin_scraper.database.service.DatabaseService") as mock_db,
+            mock.patch("linkedin_scraper.export.csv_exporter.CSVExporter") as mock_exporter,
         ):
-            mock_db.return_value.get_connections.return_value = []
-            mock_exporter.return_value.export.return_value = Path("linkedin_export_test.csv")
+            mock_db.return_value.read_connections.return_value.__enter__.return_value = (
+                0,
+                iter([]),
+            )
 
             result = runner.invoke(app, ["export"])
 
@@ -615,15 +862,25 @@ class TestExportCommand:
                 export_path = call_args[1].get("output_path")
             assert "linkedin_export" in str(export_path).lower()
 
+    def test_default_export_path_uses_utc_timestamp(self) -> None:
+        """Test that the default export filename embeds a YYYYMMDD_HHMMSS timestamp."""
+        frozen = time.gmtime(datetime(2025, 3, 7, 4, 5, 9, tzinfo=UTC).timestamp())
+        with mock.patch("time.gmtime", return_value=frozen):
+            path = _generate_default_export_path()
+
+        assert path == Path("linkedin_export_20250307_040509.csv")
+
     def test_export_warns_when_no_records(self, runner: CliRunner, temp_settings_env: str) -> None:
         """Test that export shows warning when no records to export."""
         output_path = Path(temp_settings_env) / "export.csv"
         with (
-            mock.patch("linkedin_scraper.cli.DatabaseService") as mock_db,
-            mock.patch("linkedin_scraper.cli.CSVExporter") as mock_exporter,
+            mock.patch("linkedin_scraper.database.service.DatabaseService") as mock_db,
+            mock.patch("linkedin_scraper.export.csv_exporter.CSVExporter"),
         ):
-            mock_db.return_value.get_connections.return_value = []
-            mock_exporter.return_value.export.return_value = output_path
+            mock_db.return_value.read_connections.return_value.__enter__.return_value = (
+                0,
+                iter([]),
+            )
 
             result = runner.invoke(app, ["export", "-o", str(output_path)])
 
@@ -639,7 +896,7 @@ class TestStatusCommand:
         self, runner: CliRunner, temp_settings_env: str
     ) -> None:
         """Test that status command displays rate limit information."""
-        with mock.patch("linkedin_scraper.cli.RateLimitDisplay") as mock_display:
+        with mock.patch("linkedin_scraper.rate_limit.display.RateLimitDisplay") as mock_display:
             # Create a mock panel
             from rich.panel import Panel
 
@@ -655,7 +912,7 @@ class TestStatusCommand:
         self, runner: CliRunner, temp_settings_env: str
     ) -> None:
         """Test that status command displays database statistics."""
-        with mock.patch("linkedin_scraper.cli.get_database_stats") as mock_stats:
+        with mock.patch("linkedin_scraper.database.stats.get_database_stats") as mock_stats:
             mock_stats.return_value = {
                 "total_connections": 150,
                 "unique_companies": 25,
@@ -672,8 +929,8 @@ class TestStatusCommand:
     def test_status_displays_account_list(self, runner: CliRunner, temp_settings_env: str) -> None:
         """Test that status command displays stored accounts."""
         with (
-            mock.patch("linkedin_scraper.cli.CookieManager") as mock_cm,
-            mock.patch("linkedin_scraper.cli.get_database_stats") as mock_stats,
+            mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm,
+            mock.patch("linkedin_scraper.database.stats.get_database_stats") as mock_stats,
         ):
             mock_cm.return_value.list_accounts.return_value = ["default", "work"]
             mock_stats.return_value = {
@@ -694,8 +951,8 @@ class TestStatusCommand:
     ) -> None:
         """Test that status shows message when no accounts are stored."""
         with (
-            mock.patch("linkedin_scraper.cli.CookieManager") as mock_cm,
-            mock.patch("linkedin_scraper.cli.get_database_stats") as mock_stats,
+            mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm,
+            mock.patch("linkedin_scraper.database.stats.get_database_stats") as mock_stats,
         ):
             mock_cm.return_value.list_accounts.return_value = []
             mock_stats.return_value = {
@@ -720,9 +977,9 @@ class TestStatusCommand:
     ) -> None:
         """Test that --account option validates the specific account's cookies."""
         with (
-            mock.patch("linkedin_scraper.cli.CookieManager") as mock_cm,
-            mock.patch("linkedin_scraper.cli.LinkedInClient") as mock_li,
-            mock.patch("linkedin_scraper.cli.get_database_stats") as mock_stats,
+            mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm,
+            mock.patch("linkedin_scraper.linkedin.client.LinkedInClient") as mock_li,
+            mock.patch("linkedin_scraper.database.stats.get_database_stats") as mock_stats,
         ):
             mock_cm.return_value.list_accounts.return_value = ["work"]
             mock_cm.return_value.get_cookies.return_value = {
@@ -745,14 +1002,80 @@ class TestStatusCommand:
             # Should validate session
             mock_li.return_value.validate_session.assert_called_once()
 
+    def test_status_validates_while_reading_local_stats(
+        self, runner: CliRunner, temp_settings_env: str
+    ) -> None:
+        """Test that the network validation is started before the database queries."""
+        validation_started = threading.Event()
+        overlapped: list[bool] = []
+
+        def validate_session() -> bool:
+            validation_started.set()
+            return True
+
+        def database_stats(_db_service: object) -> dict[str, object]:
+            overlapped.append(validation_started.wait(timeout=5))
+            return {"total_connections": 0, "degree_distribution": {}}
+
+        with (
+            mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm,
+            mock.patch("linkedin_scraper.linkedin.client.LinkedInClient") as mock_li,
+            mock.patch(
+                "linkedin_scraper.database.stats.get_database_stats", side_effect=database_stats
+            ),
+        ):
+            mock_cm.return_value.list_accounts.return_value = ["work"]
+            mock_cm.return_value.get_cookies.return_value = {
+                "li_at": "valid_li_at",
+                "JSESSIONID": "ajax:123",
+            }
+            mock_li.return_value.validate_session.side_effect = validate_session
+            result = runner.invoke(app, ["status", "--account", "work"])
+
+        assert result.exit_code == 0
+        assert overlapped == [True]
+        assert "is valid and active" in result.output
+
+    def test_status_reuses_recent_validation(
+        self, runner: CliRunner, temp_settings_env: str
+    ) -> None:
+        """Test that a recently validated session skips the network check."""
+        with (
+            mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm,
+            mock.patch("linkedin_scraper.linkedin.client.LinkedInClient") as mock_li,
+            mock.patch("linkedin_scraper.database.stats.get_database_stats") as mock_stats,
+        ):
+            mock_cm.return_value.list_accounts.return_value = ["work"]
+            mock_cm.return_value.get_cookies.return_value = {
+                "li_at": "valid_li_at",
+                "JSESSIONID": "ajax:123",
+            }
+            mock_li.return_value.validate_session.return_value = True
+            mock_stats.return_value = {
+                "total_connections": 0,
+                "unique_companies": 0,
+                "unique_locations": 0,
+                "recent_searches_count": 0,
+                "search_queries": [],
+                "degree_distribution": {},
+            }
+            first = runner.invoke(app, ["status", "--account", "work"])
+            second = runner.invoke(app, ["status", "--account", "work"])
+
+            assert first.exit_code == 0
+            assert second.exit_code == 0
+            mock_li.return_value.validate_session.assert_called_once()
+            assert "Validating session" not in second.output
+            assert "is valid and active" in second.output
+
     def test_status_shows_valid_session_message(
         self, runner: CliRunner, temp_settings_env: str
     ) -> None:
         """Test that status shows valid session message when cookies are valid."""
         with (
-            mock.patch("linkedin_scraper.cli.CookieManager") as mock_cm,
-            mock.patch("linkedin_scraper.cli.LinkedInClient") as mock_li,
-            mock.patch("linkedin_scraper.cli.get_database_stats") as mock_stats,
+            mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm,
+            mock.patch("linkedin_scraper.linkedin.client.LinkedInClient") as mock_li,
+            mock.patch("linkedin_scraper.database.stats.get_database_stats") as mock_stats,
         ):
             mock_cm.return_value.list_accounts.return_value = ["default"]
             mock_cm.return_value.get_cookies.return_value = {
@@ -778,9 +1101,9 @@ class TestStatusCommand:
     ) -> None:
         """Test that status shows invalid session message when cookies are expired."""
         with (
-            mock.patch("linkedin_scraper.cli.CookieManager") as mock_cm,
-            mock.patch("linkedin_scraper.cli.LinkedInClient") as mock_li,
-            mock.patch("linkedin_scraper.cli.get_database_stats") as mock_stats,
+            mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm,
+            mock.patch("linkedin_scraper.linkedin.client.LinkedInClient") as mock_li,
+            mock.patch("linkedin_scraper.database.stats.get_database_stats") as mock_stats,
         ):
             mock_cm.return_value.list_accounts.return_value = ["default"]
             mock_cm.return_value.get_cookies.return_value = {
@@ -810,8 +1133,8 @@ class TestStatusCommand:
     ) -> None:
         """Test that status shows message when specified account is not found."""
         with (
-            mock.patch("linkedin_scraper.cli.CookieManager") as mock_cm,
-            mock.patch("linkedin_scraper.cli.get_database_stats") as mock_stats,
+            mock.patch("linkedin_scraper.auth.cookie_manager.CookieManager") as mock_cm,
+            mock.patch("linkedin_scraper.database.stats.get_database_stats") as mock_stats,
         ):
             mock_cm.return_value.list_accounts.return_value = []
             mock_cm.return_value.get_cookies.return_value = None
@@ -836,11 +1159,29 @@ class TestStatusCommand:
         assert result.exit_code == 0
         assert "--account" in result.output or "-a" in result.output
 
+    def test_status_prints_all_sections_once(
+        self, runner: CliRunner, temp_settings_env: str
+    ) -> None:
+        """Test that status renders its panels in a single grouped print."""
+        from rich.console import Group
+        from rich.panel import Panel
+
+        with mock.patch("linkedin_scraper.cli._get_console") as mock_console:
+            result = runner.invoke(app, ["status"])
+
+        assert result.exit_code == 0
+        print_calls = mock_console.return_value.print.call_args_list
+        assert len(print_calls) == 1
+        group = print_calls[0].args[0]
+        assert isinstance(group, Group)
+        titles = [r.title for r in group.renderables if isinstance(r, Panel)]
+        assert titles == ["Rate Limit Status", "Database Statistics", "Stored Accounts"]
+
     def test_status_displays_degree_distribution(
         self, runner: CliRunner, temp_settings_env: str
     ) -> None:
         """Test that status displays connection degree distribution."""
-        with mock.patch("linkedin_scraper.cli.get_database_stats") as mock_stats:
+        with mock.patch("linkedin_scraper.database.stats.get_database_stats") as mock_stats:
             mock_stats.return_value = {
                 "total_connections": 150,
                 "unique_companies": 25,
@@ -859,6 +1200,55 @@ class TestStatusCommand:
                 or "degree" in result.output.lower()
             )
 
+    def test_database_stats_panel_labels_degrees(self) -> None:
+        """Test that the stats panel renders ordinal degree labels and count rows."""
+        from rich.console import Console
+
+        panel = _render_database_stats_panel(
+            {
+                "total_connections": 7,
+                "unique_companies": 3,
+                "degree_distribution": {1: 4, 2: 2, 4: 1},
+            }
+        )
+        console = Console(width=120, record=True, file=io.StringIO())
+        console.print(panel)
+        output = console.export_text()
+
+        assert "Total Connections:  7" in output
+        assert "Unique Locations:   0" in output
+        assert "1st: 4, 2nd: 2, 4th: 1" in output
+
+    def test_database_stats_panel_uses_prestyled_cells(self) -> None:
+        """Test that stats values are pre-styled Text cells rather than markup strings."""
+        from rich.table import Table
+        from rich.text import Text
+
+        panel = _render_database_stats_panel({"total_connections": 7})
+        table = panel.renderable
+        assert isinstance(table, Table)
+
+        values = list(table.columns[1].cells)
+        assert all(isinstance(cell, Text) for cell in values)
+        assert values[0].plain == "7"
+        assert values[0].style == "cyan"
+
+    def test_accounts_panel_shows_validation_status_per_account(self) -> None:
+        """Test that each account gets its own validity status in the accounts panel."""
+        from rich.console import Console
+
+        panel = _render_accounts_panel(["alice", "bob", "carol"], {"alice": True, "bob": False})
+        console = Console(width=120, record=True, file=io.StringIO())
+        console.print(panel)
+        lines = console.export_text().splitlines()
+
+        def status_of(name: str) -> str:
+            return next(line for line in lines if f" {name} " in line)
+
+        assert "Valid" in status_of("alice") and "Expired" not in status_of("alice")
+        assert "Expired/Invalid" in status_of("bob")
+        assert "Not checked" in status_of("carol")
+
 
 class TestToSAcceptance:
     """Tests for Terms of Service acceptance flow."""
@@ -896,6 +1286,38 @@ class TestToSAcceptance:
             or "accounts" in result.output.lower()
         )
 
+    def test_interactive_acceptance_is_remembered(
+        self, runner: CliRunner, temp_settings_env_tos_not_accepted: str
+    ) -> None:
+        """Test that accepting at the prompt saves acceptance for later runs."""
+        first = runner.invoke(app, ["status"], input="y\n")
+        assert first.exit_code == 0
+
+        tos_file = Path(temp_settings_env_tos_not_accepted) / "tos.json"
+        data = json.loads(tos_file.read_text())
+        assert data["accepted"] is True
+        assert "accepted_at" in data
+        assert list(tos_file.parent.glob("tos.json.*.tmp")) == []
+
+        second = runner.invoke(app, ["status"])
+        assert second.exit_code == 0
+        assert "do you accept" not in second.output.lower()
+
+    def test_declining_does_not_save_acceptance(
+        self, runner: CliRunner, temp_settings_env_tos_not_accepted: str
+    ) -> None:
+        """Test that declining the prompt leaves no acceptance record."""
+        runner.invoke(app, ["status"], input="n\n")
+        assert not (Path(temp_settings_env_tos_not_accepted) / "tos.json").exists()
+
+    def test_corrupt_tos_file_prompts_again(
+        self, runner: CliRunner, temp_settings_env_tos_not_accepted: str
+    ) -> None:
+        """Test that an unreadable acceptance file is ignored."""
+        (Path(temp_settings_env_tos_not_accepted) / "tos.json").write_text("not json")
+        result = runner.invoke(app, ["status"], input="n\n")
+        assert "do you accept" in result.output.lower()
+
     def test_skips_tos_when_already_accepted(
         self, runner: CliRunner, temp_settings_env: str
     ) -> None:
@@ -911,6 +1333,49 @@ class TestToSAcceptance:
         # Should not ask about acceptance
         assert "do you accept" not in result.output.lower()
 
+    def test_settings_constructed_once_per_invocation(
+        self, runner: CliRunner, temp_settings_env: str
+    ) -> None:
+        """Test that the ToS check and the command share one Settings instance."""
+        from linkedin_scraper.config import Settings
+
+        with mock.patch("linkedin_scraper.config.Settings", wraps=Settings) as mock_settings:
+            result = runner.invoke(app, ["status"])
+
+        assert result.exit_code == 0
+        mock_settings.assert_called_once()
+
+    def test_tos_panel_is_built_once_from_parsed_markup(self) -> None:
+        """Test that the ToS panel is cached and holds pre-parsed Text."""
+        from rich.text import Text
+
+        panel = _tos_panel()
+        assert _tos_panel() is panel
+        assert isinstance(panel.renderable, Text)
+        assert "[bold" not in panel.renderable.plain
+
+    @pytest.mark.parametrize("value", ["1", "true", "TRUE", "yes", " on "])
+    def test_env_preacceptance_skips_settings(self, value: str) -> None:
+        """Test that a truthy LINKEDIN_SCRAPER_TOS_ACCEPTED accepts without loading Settings."""
+        with (
+            mock.patch.dict(os.environ, {"LINKEDIN_SCRAPER_TOS_ACCEPTED": value}),
+            mock.patch("linkedin_scraper.config.get_settings") as mock_get_settings,
+        ):
+            assert _check_tos_acceptance() is True
+
+        mock_get_settings.assert_not_called()
+
+    def test_falsy_env_falls_back_to_settings(self) -> None:
+        """Test that a non-truthy env value defers to the loaded Settings."""
+        with (
+            mock.patch.dict(os.environ, {"LINKEDIN_SCRAPER_TOS_ACCEPTED": "false"}),
+            mock.patch("linkedin_scraper.config.get_settings") as mock_get_settings,
+        ):
+            mock_get_settings.return_value.tos_accepted = True
+            assert _check_tos_acceptance() is True
+
+        mock_get_settings.assert_called_once()
+
 
 class TestDebugFlag:
     """Tests for the --debug flag functionality."""
@@ -925,7 +1390,7 @@ class TestDebugFlag:
         self, runner: CliRunner, temp_settings_env: str
     ) -> None:
         """Test that --debug flag shows traceback when error occurs."""
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.side_effect = Exception(
                 "Unexpected error"
             )
@@ -941,7 +1406,7 @@ class TestDebugFlag:
         self, runner: CliRunner, temp_settings_env: str
     ) -> None:
         """Test that traceback is not shown without --debug flag."""
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.side_effect = Exception(
                 "Unexpected error"
             )
@@ -959,7 +1424,7 @@ class TestErrorHandling:
         """Test that network errors suggest retry."""
         import urllib.error
 
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.side_effect = (
                 urllib.error.URLError("Connection refused")
             )
@@ -974,7 +1439,7 @@ class TestErrorHandling:
 
     def test_generic_error_shows_details(self, runner: CliRunner, temp_settings_env: str) -> None:
         """Test that generic errors show error details."""
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.side_effect = RuntimeError(
                 "Something unexpected"
             )
@@ -985,7 +1450,7 @@ class TestErrorHandling:
 
     def test_auth_error_shows_cookie_help(self, runner: CliRunner, temp_settings_env: str) -> None:
         """Test that auth errors display cookie help information."""
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.side_effect = LinkedInAuthError(
                 "Invalid cookie"
             )
@@ -1003,7 +1468,7 @@ class TestErrorHandling:
     ) -> None:
         """Test that rate limit errors show when to try again."""
         reset_time = datetime.now(UTC)
-        with mock.patch("linkedin_scraper.cli.SearchOrchestrator") as mock_orch:
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
             mock_orch.return_value.execute_search_with_company_name.side_effect = RateLimitExceeded(
                 "Daily limit reached", reset_time=reset_time
             )
@@ -1015,3 +1480,15 @@ class TestErrorHandling:
                 or "tomorrow" in result.output.lower()
                 or "midnight" in result.output.lower()
             )
+
+    def test_rate_limit_exceeded_without_reset_time_shows_message(
+        self, runner: CliRunner, temp_settings_env: str
+    ) -> None:
+        """Test that rate limit errors without a reset time show the error message."""
+        with mock.patch("linkedin_scraper.search.orchestrator.SearchOrchestrator") as mock_orch:
+            mock_orch.return_value.execute_search_with_company_name.side_effect = RateLimitExceeded(
+                "Daily limit reached"
+            )
+            result = runner.invoke(app, ["search", "-k", "engineer"])
+            assert result.exit_code != 0
+            assert "Daily limit reached" in result.output
@@ -2,6 +2,7 @@
 # ABOUTME: Covers cookie storage, retrieval, validation, and account management.
 
 import json
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -21,10 +22,16 @@ def temp_accounts_file() -> Path:
 @pytest.fixture
 def mock_keyring() -> MagicMock:
     """Create a mock keyring for testing."""
-    with patch("linkedin_scraper.auth.cookie_manager.keyring") as mock:
-        mock.get_password = MagicMock(return_value=None)
-        mock.set_password = MagicMock()
-        mock.delete_password = MagicMock()
+    mock = MagicMock()
+    mock.get_password = MagicMock(return_value=None)
+    mock.set_password = MagicMock()
+    mock.delete_password = MagicMock()
+    with patch.multiple(
+        "keyring",
+        get_password=mock.get_password,
+        set_password=mock.set_password,
+        delete_password=mock.delete_password,
+    ):
         yield mock
 
 
@@ -164,6 +171,90 @@ class TestGetCookie:
 
         assert cookie is None
 
+    def test_get_cookie_memoizes_keyring_lookup(
+        self, cookie_manager: CookieManager, mock_keyring: MagicMock
+    ) -> None:
+        """Test that repeated reads of one account hit the keyring only once."""
+        mock_keyring.get_password.return_value = "AQEDAQNhS28F1234stored_cookie"
+
+        cookie_manager.get_cookie(account_name="work")
+        cookie_manager.get_cookies(account_name="work")
+        cookie_manager.get_cookie(account_name="work")
+
+        mock_keyring.get_password.assert_called_once_with("linkedin-scraper", "work")
+
+    def test_get_cookie_does_not_memoize_missing_account(
+        self, cookie_manager: CookieManager, mock_keyring: MagicMock
+    ) -> None:
+        """Test that a miss is re-read, so cookies stored elsewhere are picked up."""
+        mock_keyring.get_password.return_value = None
+        assert cookie_manager.get_cookie(account_name="work") is None
+
+        # Stored by another CookieManager or process
+        mock_keyring.get_password.return_value = "AQEDAQNhS28F1234stored_cookie"
+
+        assert cookie_manager.get_cookie(account_name="work") == "AQEDAQNhS28F1234stored_cookie"
+        assert mock_keyring.get_password.call_count == 2
+
+    def test_get_cookie_sees_value_stored_by_same_instance(
+        self, cookie_manager: CookieManager, mock_keyring: MagicMock
+    ) -> None:
+        """Test that storing a cookie replaces the memoized value."""
+        assert cookie_manager.get_cookie(account_name="work") is None
+
+        cookie_manager.store_cookies("new_li_at_value", "ajax:123456789", account_name="work")
+
+        assert cookie_manager.get_cookie(account_name="work") == "new_li_at_value"
+        mock_keyring.get_password.assert_called_once()
+
+    def test_get_cookie_rereads_after_delete(
+        self, cookie_manager: CookieManager, mock_keyring: MagicMock
+    ) -> None:
+        """Test that deleting a cookie drops the memoized value."""
+        mock_keyring.get_password.return_value = "AQEDAQNhS28F1234stored_cookie"
+        cookie_manager.get_cookie(account_name="work")
+
+        cookie_manager.delete_cookie(account_name="work")
+        mock_keyring.get_password.return_value = None
+
+        assert cookie_manager.get_cookie(account_name="work") is None
+
+
+class TestGetCookies:
+    """Tests for retrieving both cookies."""
+
+    def test_get_cookies_parses_json_format(
+        self, cookie_manager: CookieManager, mock_keyring: MagicMock
+    ) -> None:
+        """Test that get_cookies returns both values from the JSON format."""
+        mock_keyring.get_password.return_value = json.dumps(
+            {"li_at": "AQEDAQNhS28F1234li_at", "JSESSIONID": "ajax:1234567890"}
+        )
+
+        cookies = cookie_manager.get_cookies()
+
+        assert cookies == {"li_at": "AQEDAQNhS28F1234li_at", "JSESSIONID": "ajax:1234567890"}
+
+    def test_get_cookies_handles_legacy_plain_string(
+        self, cookie_manager: CookieManager, mock_keyring: MagicMock
+    ) -> None:
+        """Test that a legacy plain li_at value is returned without a JSESSIONID."""
+        mock_keyring.get_password.return_value = "AQEDAQNhS28F1234legacy"
+
+        cookies = cookie_manager.get_cookies()
+
+        assert cookies == {"li_at": "AQEDAQNhS28F1234legacy", "JSESSIONID": ""}
+
+    def test_get_cookies_falls_back_on_malformed_json(
+        self, cookie_manager: CookieManager, mock_keyring: MagicMock
+    ) -> None:
+        """Test that a value that looks like JSON but does not parse is treated as legacy."""
+        mock_keyring.get_password.return_value = "{not-json"
+
+        cookies = cookie_manager.get_cookies()
+
+        assert cookies == {"li_at": "{not-json", "JSESSIONID": ""}
+
 
 class TestDeleteCookie:
     """Tests for deleting cookies."""
@@ -272,3 +363,129 @@ class TestAccountsFilePersistence:
             manager.store_cookie("test_cookie", account_name="test")
 
             assert accounts_file.exists()
+
+    def test_accounts_file_written_in_sorted_order(
+        self, cookie_manager: CookieManager, temp_accounts_file: Path, mock_keyring: MagicMock
+    ) -> None:
+        """Test that account names are serialized in sorted order."""
+        cookie_manager.store_cookie("cookie", account_name="zeta")
+        cookie_manager.store_cookie("cookie", account_name="alpha")
+        cookie_manager.store_cookie("cookie", account_name="mid")
+
+        with open(temp_accounts_file) as f:
+            data = json.load(f)
+
+        assert data["accounts"] == ["alpha", "mid", "zeta"]
+        assert cookie_manager.list_accounts() == ["alpha", "mid", "zeta"]
+
+    def test_accounts_file_write_leaves_no_temp_file(
+        self, cookie_manager: CookieManager, temp_accounts_file: Path, mock_keyring: MagicMock
+    ) -> None:
+        """Test that the atomic write does not leave its temp file behind."""
+        cookie_manager.store_cookie("test_cookie", account_name="testaccount")
+
+        assert list(temp_accounts_file.parent.glob(f"{temp_accounts_file.name}.*.tmp")) == []
+
+    def test_accounts_file_write_uses_unique_temp_files(
+        self, cookie_manager: CookieManager, temp_accounts_file: Path, mock_keyring: MagicMock
+    ) -> None:
+        """Test that each save writes to its own temp file so concurrent saves can't collide."""
+        replaced: list[str] = []
+        real_replace = os.replace
+
+        def record_replace(src: str, dst: Path) -> None:
+            replaced.append(src)
+            real_replace(src, dst)
+
+        with patch("os.replace", side_effect=record_replace):
+            cookie_manager.store_cookie("cookie", account_name="first")
+            cookie_manager.store_cookie("cookie", account_name="second")
+
+        assert len(set(replaced)) == 2
+        assert all(Path(src).parent == temp_accounts_file.parent for src in replaced)
+        assert cookie_manager.list_accounts() == ["first", "second"]
+
+    def test_accounts_file_write_removes_temp_file_on_failure(
+        self, cookie_manager: CookieManager, temp_accounts_file: Path, mock_keyring: MagicMock
+    ) -> None:
+        """Test that a failed move into place cleans up its temp file."""
+        with (
+            patch("os.replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            cookie_manager.store_cookie("cookie", account_name="testaccount")
+
+        assert list(temp_accounts_file.parent.glob(f"{temp_accounts_file.name}.*.tmp")) == []
+
+
+class TestAccountsCache:
+    """Tests for the in-memory accounts list cache."""
+
+    def test_list_accounts_reuses_cache_when_file_unchanged(
+        self, cookie_manager: CookieManager, mock_keyring: MagicMock
+    ) -> None:
+        """Test that repeated list_accounts calls do not re-read the file."""
+        cookie_manager.store_cookie("cookie1", account_name="cached")
+
+        with patch.object(Path, "read_text") as mock_read:
+            accounts = cookie_manager.list_accounts()
+
+        mock_read.assert_not_called()
+        assert accounts == ["cached"]
+
+    def test_list_accounts_returns_copy_of_cache(
+        self, cookie_manager: CookieManager, mock_keyring: MagicMock
+    ) -> None:
+        """Test that mutating the returned list does not corrupt the cache."""
+        cookie_manager.store_cookie("cookie1", account_name="cached")
+
+        cookie_manager.list_accounts().append("intruder")
+
+        assert cookie_manager.list_accounts() == ["cached"]
+
+    def test_list_accounts_sees_external_writes(
+        self, cookie_manager: CookieManager, temp_accounts_file: Path, mock_keyring: MagicMock
+    ) -> None:
+        """Test that a file written by another process invalidates the cache."""
+        cookie_manager.store_cookie("cookie1", account_name="first")
+        mtime = temp_accounts_file.stat().st_mtime_ns
+
+        temp_accounts_file.write_text(json.dumps({"accounts": ["first", "external"]}))
+        os.utime(temp_accounts_file, ns=(mtime + 1_000_000_000, mtime + 1_000_000_000))
+
+        assert cookie_manager.list_accounts() == ["external", "first"]
+
+    def test_list_accounts_sees_write_within_same_mtime(
+        self, cookie_manager: CookieManager, temp_accounts_file: Path, mock_keyring: MagicMock
+    ) -> None:
+        """Test that a rewrite keeping the old mtime is still detected."""
+        cookie_manager.store_cookie("cookie1", account_name="first")
+        st = temp_accounts_file.stat()
+
+        # Rewrite in place and restore the timestamp, as on a coarse-mtime filesystem
+        temp_accounts_file.write_text(json.dumps({"accounts": ["first", "same-tick"]}))
+        os.utime(temp_accounts_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert cookie_manager.list_accounts() == ["first", "same-tick"]
+
+    def test_list_accounts_empty_after_file_deleted(
+        self, cookie_manager: CookieManager, temp_accounts_file: Path, mock_keyring: MagicMock
+    ) -> None:
+        """Test that deleting the accounts file clears the cached list."""
+        cookie_manager.store_cookie("cookie1", account_name="gone")
+
+        temp_accounts_file.unlink()
+
+        assert cookie_manager.list_accounts() == []
+
+    def test_list_accounts_missing_file_skips_read(
+        self, cookie_manager: CookieManager, temp_accounts_file: Path, mock_keyring: MagicMock
+    ) -> None:
+        """Test that a missing accounts file is detected by stat alone, without a read."""
+        temp_accounts_file.unlink(missing_ok=True)
+
+        with patch.object(Path, "read_text") as mock_read:
+            accounts = cookie_manager.list_accounts()
+
+        mock_read.assert_not_called()
+        assert accounts == []
@@ -296,3 +296,35 @@ class TestCSVExporter:
 
         metadata_text = " ".join(metadata_row)
         assert "software engineer" in metadata_text.lower()
+
+    def test_export_accepts_iterator_with_record_count(
+        self, sample_profiles: list[ConnectionProfile], temp_output_path: Path
+    ) -> None:
+        """Test that export streams a one-shot iterator using the given record count."""
+        from linkedin_scraper.export.csv_exporter import CSVExporter
+
+        exporter = CSVExporter()
+        exporter.export(iter(sample_profiles), temp_output_path, record_count=2)
+
+        with open(temp_output_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+
+        assert "Records: 2" in " ".join(rows[0])
+        assert [row[0] for row in rows[2:]] == ["John Doe", "Jane Smith"]
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (datetime(2025, 6, 15, 10, 30, 5), "2025-06-15 10:30:05"),
+            (datetime(2025, 6, 15, 10, 30, 5, 123456), "2025-06-15 10:30:05"),
+            (datetime(2025, 6, 15, 10, 30, 5, tzinfo=UTC), "2025-06-15 10:30:05"),
+            (None, ""),
+        ],
+    )
+    def test_format_timestamp_matches_strftime_layout(
+        self, value: datetime | None, expected: str
+    ) -> None:
+        """Test that found_at is written as YYYY-MM-DD HH:MM:SS regardless of tz or micros."""
+        from linkedin_scraper.export.csv_exporter import CSVExporter
+
+        assert CSVExporter._format_timestamp(value) == expected
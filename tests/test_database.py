@@ -4,8 +4,11 @@
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
 import pytest
+from sqlmodel import SQLModel
 
 from linkedin_scraper.database import DatabaseService
 from linkedin_scraper.models import ActionType, ConnectionProfile, RateLimitEntry
@@ -40,6 +43,40 @@ class TestDatabaseServiceInit:
         expected_path = Path.home() / ".linkedin-scraper" / "data.db"
         assert service.db_path == expected_path
 
+    def test_services_on_same_path_share_engine(self, temp_db_path: Path) -> None:
+        """Test that services pointing at the same file reuse one engine."""
+        first = DatabaseService(db_path=temp_db_path)
+        second = DatabaseService(db_path=temp_db_path.parent / "." / temp_db_path.name)
+        other = DatabaseService(db_path=temp_db_path.with_name("other.db"))
+
+        assert first._engine is second._engine
+        assert first._engine is not other._engine
+
+    def test_memory_database_stays_in_memory(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that ':memory:' is not resolved into a file and is private per service."""
+        monkeypatch.chdir(tmp_path)
+        first = DatabaseService(db_path=Path(":memory:"))
+        second = DatabaseService(db_path=Path(":memory:"))
+        first.init_db()
+
+        assert first._engine is not second._engine
+        assert first.get_connections() == []
+        assert list(tmp_path.iterdir()) == []
+
+    def test_dispose_engines_releases_shared_engines(self, temp_db_path: Path) -> None:
+        """Test that disposing the shared engines gives later services a new one."""
+        from linkedin_scraper.database.service import dispose_engines
+
+        first = DatabaseService(db_path=temp_db_path)
+        first.init_db()
+        dispose_engines()
+        second = DatabaseService(db_path=temp_db_path)
+
+        assert first._engine is not second._engine
+        assert first.get_connections() == []
+
     def test_init_db_creates_tables(self, temp_db_path: Path) -> None:
         """Test that init_db creates the required tables."""
         service = DatabaseService(db_path=temp_db_path)
@@ -57,6 +94,60 @@ class TestDatabaseServiceInit:
             service.init_db()
             assert db_path.parent.exists()
 
+    def test_init_db_is_idempotent(self, temp_db_path: Path) -> None:
+        """Test that repeated init_db calls only create tables once."""
+        service = DatabaseService(db_path=temp_db_path)
+        service.init_db()
+
+        with patch.object(SQLModel.metadata, "create_all") as mock_create_all:
+            service.init_db()
+
+        mock_create_all.assert_not_called()
+
+    def test_init_db_creates_lookup_indexes(self, db_service: DatabaseService) -> None:
+        """Test that the query and rate limit lookup columns are indexed."""
+        from sqlalchemy import inspect
+
+        inspector = inspect(db_service._engine)
+        profile_indexes = {
+            tuple(index["column_names"]) for index in inspector.get_indexes("connection_profiles")
+        }
+        rate_limit_indexes = {
+            tuple(index["column_names"]) for index in inspector.get_indexes("rate_limit_entries")
+        }
+
+        assert ("linkedin_urn_id",) in profile_indexes
+        assert ("search_query",) in profile_indexes
+        assert ("timestamp", "action_type") in rate_limit_indexes
+
+    def test_init_db_adds_missing_indexes_to_existing_tables(self, temp_db_path: Path) -> None:
+        """Test that a database created without an index gets it on init."""
+        from sqlalchemy import inspect, text
+
+        DatabaseService(db_path=temp_db_path).init_db()
+        old_service = DatabaseService(db_path=temp_db_path)
+        with old_service._engine.begin() as connection:
+            connection.execute(text("DROP INDEX ix_connection_profiles_search_query"))
+
+        service = DatabaseService(db_path=temp_db_path)
+        service.init_db()
+
+        indexes = inspect(service._engine).get_indexes("connection_profiles")
+        assert ("search_query",) in {tuple(index["column_names"]) for index in indexes}
+
+    def test_connections_use_wal_and_tuned_pragmas(self, db_service: DatabaseService) -> None:
+        """Test that new connections are switched to WAL with relaxed syncing."""
+        from sqlalchemy import text
+
+        with db_service.get_session() as session:
+            journal_mode = session.exec(text("PRAGMA journal_mode")).scalar()
+            synchronous = session.exec(text("PRAGMA synchronous")).scalar()
+            temp_store = session.exec(text("PRAGMA temp_store")).scalar()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+        assert temp_store == 2  # MEMORY
+
 
 class TestDatabaseServiceSession:
     """Tests for session management."""
@@ -109,6 +200,70 @@ class TestConnectionProfileOperations:
         assert len(connections) == 1
         assert connections[0].public_id == "jane-smith"
 
+    def test_save_connections_persists_all_profiles(self, db_service: DatabaseService) -> None:
+        """Test that bulk save stores every profile and keeps attributes readable."""
+        profiles = [
+            ConnectionProfile(
+                linkedin_urn_id=f"urn:li:member:bulk{i}",
+                public_id=f"bulk-{i}",
+                first_name=f"Bulk{i}",
+                last_name="User",
+                profile_url=f"https://linkedin.com/in/bulk-{i}",
+                connection_degree=2,
+            )
+            for i in range(5)
+        ]
+
+        saved = db_service.save_connections(profiles)
+
+        assert [p.first_name for p in saved] == [f"Bulk{i}" for i in range(5)]
+        assert all(p.id is not None for p in saved)
+        assert len(db_service.get_connections()) == 5
+
+    def test_save_connections_stores_profiles_unchanged(self, db_service: DatabaseService) -> None:
+        """Test that bulk-inserted rows read back with the same IDs and values."""
+        profile = ConnectionProfile(
+            linkedin_urn_id="urn:li:member:roundtrip",
+            public_id="round-trip",
+            first_name="Round",
+            last_name="Trip",
+            headline="Engineer",
+            profile_url="https://linkedin.com/in/round-trip",
+            connection_degree=3,
+            search_query="engineer",
+        )
+
+        db_service.save_connections([profile])
+        stored = db_service.get_connection_by_urn("urn:li:member:roundtrip")
+
+        assert stored is not None
+        assert stored.id == profile.id
+        assert stored.headline == "Engineer"
+        assert stored.search_query == "engineer"
+        assert stored.found_at == profile.found_at
+
+    def test_save_connections_commits_once_per_batch(self, db_service: DatabaseService) -> None:
+        """Test that bulk save commits per batch rather than per profile."""
+        from sqlmodel import Session
+
+        profiles = [
+            ConnectionProfile(
+                linkedin_urn_id=f"urn:li:member:batch{i}",
+                public_id=f"batch-{i}",
+                first_name="Batch",
+                last_name=str(i),
+                profile_url=f"https://linkedin.com/in/batch-{i}",
+                connection_degree=1,
+            )
+            for i in range(5)
+        ]
+
+        with patch.object(Session, "commit", autospec=True, side_effect=Session.commit) as commit:
+            db_service.save_connections(profiles, batch_size=2)
+
+        assert commit.call_count == 3
+        assert len(db_service.get_connections()) == 5
+
     def test_get_connections_returns_empty_list_when_no_data(
         self, db_service: DatabaseService
     ) -> None:
@@ -148,6 +303,92 @@ class TestConnectionProfileOperations:
         connections = db_service.get_connections(limit=2, offset=2)
         assert len(connections) == 2
 
+    def test_read_connections_streams_all_profiles(self, db_service: DatabaseService) -> None:
+        """Test that read_connections yields every stored profile across batches."""
+        for i in range(5):
+            profile = ConnectionProfile(
+                linkedin_urn_id=f"urn:li:member:{i}",
+                public_id=f"user-{i}",
+                first_name=f"User{i}",
+                last_name="Test",
+                profile_url=f"https://linkedin.com/in/user-{i}",
+                connection_degree=1,
+            )
+            db_service.save_connection(profile)
+
+        with db_service.read_connections(batch_size=2) as (count, rows):
+            profiles = list(rows)
+        assert count == 5
+        assert sorted(p.public_id for p in profiles) == [f"user-{i}" for i in range(5)]
+
+        with db_service.read_connections(limit=3, batch_size=2) as (count, rows):
+            assert count == 3
+            assert len(list(rows)) == 3
+
+    def test_read_connections_counts_empty_database(self, db_service: DatabaseService) -> None:
+        """Test that read_connections reports zero rows for an empty database."""
+        with db_service.read_connections() as (count, rows):
+            assert count == 0
+            assert list(rows) == []
+
+    def test_read_connections_filters_by_query(self, db_service: DatabaseService) -> None:
+        """Test that read_connections honours the query filter in both count and rows."""
+        db_service.save_connections(
+            ConnectionProfile(
+                linkedin_urn_id=f"urn:li:member:q{i}",
+                public_id=f"q-{i}",
+                first_name="Query",
+                last_name=str(i),
+                profile_url=f"https://linkedin.com/in/q-{i}",
+                connection_degree=1,
+                search_query="engineer" if i % 2 == 0 else "designer",
+            )
+            for i in range(5)
+        )
+
+        with db_service.read_connections(query="engineer", batch_size=2) as (count, rows):
+            engineers = list(rows)
+
+        assert {p.search_query for p in engineers} == {"engineer"}
+        assert count == len(engineers) == 3
+
+    def test_read_connections_ignores_concurrent_writes(self, temp_db_path: Path) -> None:
+        """Test that a row saved between the count and the row query is not exported."""
+        from sqlalchemy import event
+
+        def profile(public_id: str) -> ConnectionProfile:
+            return ConnectionProfile(
+                linkedin_urn_id=f"urn:li:member:{public_id}",
+                public_id=public_id,
+                first_name=public_id.title(),
+                last_name="Read",
+                profile_url=f"https://linkedin.com/in/{public_id}",
+                connection_degree=1,
+            )
+
+        reader = DatabaseService(db_path=temp_db_path)
+        reader.init_db()
+        reader.save_connection(profile("before"))
+        writer = DatabaseService(db_path=temp_db_path)
+        pending = [profile("during")]
+
+        def write_before_row_query(conn: Any, cursor: Any, statement: str, *_: Any) -> None:
+            # Runs once the count has been read, just before the rows are selected
+            if pending and statement.startswith("SELECT connection_profiles."):
+                writer.save_connection(pending.pop())
+
+        event.listen(reader._engine, "before_cursor_execute", write_before_row_query)
+        try:
+            with reader.read_connections() as (count, rows):
+                profiles = list(rows)
+        finally:
+            event.remove(reader._engine, "before_cursor_execute", write_before_row_query)
+
+        assert not pending
+        assert count == 1
+        assert [p.public_id for p in profiles] == ["before"]
+        assert len(reader.get_connections()) == 2
+
     def test_get_connection_by_urn_returns_profile(self, db_service: DatabaseService) -> None:
         """Test retrieving a connection by URN ID."""
         profile = ConnectionProfile(
@@ -273,6 +514,18 @@ class TestRateLimitEntryOperations:
         assert saved.id is not None
         assert saved.action_type == ActionType.SEARCH
 
+    def test_save_rate_limit_entries(self, db_service: DatabaseService) -> None:
+        """Test saving several rate limit entries at once."""
+        entries = [
+            RateLimitEntry(action_type=ActionType.SEARCH, timestamp=datetime(2025, 6, 15, 12, i))
+            for i in range(3)
+        ]
+
+        saved = db_service.save_rate_limit_entries(entries)
+
+        assert all(entry.id is not None for entry in saved)
+        assert len(db_service.get_rate_limit_entries_since(datetime(2025, 6, 15))) == 3
+
     def test_get_rate_limit_entries_since(self, db_service: DatabaseService) -> None:
         """Test retrieving rate limit entries since a given time."""
         # Create entries with different timestamps
@@ -314,3 +567,50 @@ class TestRateLimitEntryOperations:
 
         assert len(search_entries) == 1
         assert search_entries[0].action_type == ActionType.SEARCH
+
+    def test_count_rate_limit_entries_since(self, db_service: DatabaseService) -> None:
+        """Test counting entries by time window and action type."""
+        db_service.save_rate_limit_entries(
+            [
+                RateLimitEntry(action_type=ActionType.SEARCH, timestamp=datetime(2020, 1, 1)),
+                RateLimitEntry(action_type=ActionType.SEARCH, timestamp=datetime(2025, 6, 15)),
+                RateLimitEntry(
+                    action_type=ActionType.PROFILE_VIEW, timestamp=datetime(2025, 6, 15)
+                ),
+            ]
+        )
+
+        since = datetime(2025, 1, 1)
+        assert db_service.count_rate_limit_entries_since(since) == 2
+        assert db_service.count_rate_limit_entries_since(since, ActionType.SEARCH) == 1
+
+    def test_get_latest_rate_limit_timestamp(self, db_service: DatabaseService) -> None:
+        """Test that the newest timestamp in the window is returned."""
+        since = datetime(2025, 1, 1)
+        assert db_service.get_latest_rate_limit_timestamp(since) is None
+
+        db_service.save_rate_limit_entries(
+            RateLimitEntry(action_type=ActionType.SEARCH, timestamp=timestamp)
+            for timestamp in (datetime(2025, 6, 15, 9), datetime(2025, 6, 15, 17))
+        )
+
+        assert db_service.get_latest_rate_limit_timestamp(since) == datetime(2025, 6, 15, 17)
+
+    def test_summarize_rate_limit_entries_since(self, db_service: DatabaseService) -> None:
+        """Test that the count and newest timestamp come back together."""
+        since = datetime(2025, 1, 1)
+        assert db_service.summarize_rate_limit_entries_since(since) == (0, None)
+
+        db_service.save_rate_limit_entries(
+            RateLimitEntry(action_type=action_type, timestamp=timestamp)
+            for action_type, timestamp in (
+                (ActionType.SEARCH, datetime(2020, 1, 1)),
+                (ActionType.SEARCH, datetime(2025, 6, 15, 9)),
+                (ActionType.PROFILE_VIEW, datetime(2025, 6, 15, 17)),
+            )
+        )
+
+        assert db_service.summarize_rate_limit_entries_since(since) == (
+            2,
+            datetime(2025, 6, 15, 17),
+        )
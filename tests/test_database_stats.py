@@ -165,3 +165,23 @@ class TestGetDatabaseStats:
         assert stats["degree_distribution"].get(1) == 3
         assert stats["degree_distribution"].get(2) == 2
         assert stats["degree_distribution"].get(3) == 1
+
+    def test_runs_three_queries(self, db_service: DatabaseService) -> None:
+        """Test that the counts share one scan instead of a query per metric."""
+        from sqlalchemy import event
+
+        db_service.save_connection(_create_profile("urn:li:member:1", company="Acme"))
+        statements: list[str] = []
+
+        def record(_conn: object, _cursor: object, statement: str, *_args: object) -> None:
+            statements.append(statement)
+
+        event.listen(db_service._engine, "before_cursor_execute", record)
+        try:
+            stats = get_database_stats(db_service)
+        finally:
+            event.remove(db_service._engine, "before_cursor_execute", record)
+
+        assert len(statements) == 3
+        assert stats["total_connections"] == 1
+        assert stats["unique_companies"] == 1
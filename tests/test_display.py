@@ -1,12 +1,15 @@
 # ABOUTME: Tests for the display module including ConnectionTable and status display functions.
 # ABOUTME: Covers Rich table rendering, truncation, color-coding, and panel generation.
 
+import subprocess
+import sys
 from datetime import UTC, datetime
 from uuid import uuid4
 
 import pytest
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 from linkedin_scraper.models import ConnectionProfile
 
@@ -210,6 +213,14 @@ class TestConnectionTableRender:
 
         assert result.row_count == len(sample_profiles)
 
+    def test_render_accepts_generator(self, sample_profiles: list[ConnectionProfile]) -> None:
+        """render() should consume a one-shot iterator of profiles."""
+        from linkedin_scraper.display import ConnectionTable
+
+        result = ConnectionTable().render(profile for profile in sample_profiles)
+
+        assert result.row_count == len(sample_profiles)
+
 
 class TestConnectionTableTruncation:
     """Tests for headline and company name truncation."""
@@ -249,6 +260,30 @@ class TestConnectionTableTruncation:
 
         assert isinstance(result, Table)
 
+    def test_truncation_boundaries_in_rows(self) -> None:
+        """Values at the limit are kept; one character over gets an ellipsis."""
+        from linkedin_scraper.display import ConnectionTable
+
+        table = ConnectionTable()
+        profile = ConnectionProfile(
+            id=uuid4(),
+            linkedin_urn_id="urn:li:fsd_profile:EDGE",
+            public_id="edge",
+            first_name="Edge",
+            last_name="Case",
+            headline="h" * table.MAX_HEADLINE_LENGTH,
+            current_company="c" * (table.MAX_COMPANY_LENGTH + 1),
+            location="l" * (table.MAX_LOCATION_LENGTH + 1),
+            profile_url="https://linkedin.com/in/edge",
+            connection_degree=1,
+        )
+
+        _, _, headline, company, location, _ = next(table._profiles_to_rows([profile]))
+
+        assert headline == "h" * table.MAX_HEADLINE_LENGTH
+        assert company == "c" * (table.MAX_COMPANY_LENGTH - 3) + "..."
+        assert location == "l" * (table.MAX_LOCATION_LENGTH - 3) + "..."
+
 
 class TestConnectionTableColorCoding:
     """Tests for connection degree color-coding."""
@@ -315,6 +350,47 @@ class TestConnectionTableColorCoding:
 
         assert isinstance(result, Table)
 
+    def test_degree_styled_cells(self) -> None:
+        """Each degree should map to a pre-styled Text cell, unknown degrees to white."""
+        from linkedin_scraper.display import ConnectionTable
+
+        table = ConnectionTable()
+
+        cells = [table._get_degree_styled(degree) for degree in (1, 2, 3, 4)]
+
+        assert [(cell.plain, cell.style) for cell in cells] == [
+            ("1", "green"),
+            ("2", "yellow"),
+            ("3", "red"),
+            ("4", "white"),
+        ]
+        assert table._get_degree_styled(1) is table._get_degree_styled(1)
+
+    def test_profiles_to_rows_builds_plain_rows(self) -> None:
+        """Rows should hold the numbered, truncated and styled cell strings."""
+        from linkedin_scraper.display import ConnectionTable
+
+        profile = ConnectionProfile(
+            id=uuid4(),
+            linkedin_urn_id="urn:li:fsd_profile:ROW1",
+            public_id="row-one",
+            first_name="Row",
+            last_name="One",
+            headline="H" * 60,
+            current_company="Acme",
+            location=None,
+            profile_url="https://linkedin.com/in/row-one",
+            connection_degree=2,
+        )
+
+        rows = list(ConnectionTable()._profiles_to_rows([profile]))
+
+        assert len(rows) == 1
+        *cells, degree = rows[0]
+        assert cells == ["1", "Row One", "H" * 37 + "...", "Acme", ""]
+        assert isinstance(degree, Text)
+        assert (degree.plain, degree.style) == ("2", "yellow")
+
 
 class TestConnectionTableMissingFields:
     """Tests for handling profiles with missing optional fields."""
@@ -453,6 +529,31 @@ class TestDisplayRateLimitWarning:
 
         assert isinstance(result, Panel)
 
+    @pytest.mark.parametrize(
+        ("remaining", "expected_line", "style"),
+        [
+            (0, "Daily rate limit reached!", "bold red"),
+            (1, "Only 1 search remaining for today.", "yellow"),
+            (3, "Only 3 searches remaining for today.", "yellow"),
+        ],
+    )
+    def test_display_rate_limit_warning_styles_first_line(
+        self, remaining: int, expected_line: str, style: str
+    ) -> None:
+        """The first line should carry the style; the advice line stays unstyled."""
+        from linkedin_scraper.display.status import display_rate_limit_warning
+
+        result = display_rate_limit_warning(remaining=remaining)
+        assert result is not None
+        message = result.renderable
+        assert isinstance(message, Text)
+
+        first_line, _ = message.plain.split("\n", 1)
+        assert first_line == expected_line
+        assert [(span.start, span.end, span.style) for span in message.spans] == [
+            (0, len(expected_line), style)
+        ]
+
 
 class TestDisplayModuleExports:
     """Tests for display module exports."""
@@ -475,6 +576,26 @@ class TestDisplayModuleExports:
 
         assert callable(display_rate_limit_warning)
 
+    def test_package_exports_resolve_lazily(self) -> None:
+        """Importing the table module should not load the error helpers."""
+        code = (
+            "import sys, linkedin_scraper.display.tables; "
+            "loaded = 'linkedin_scraper.display.errors' in sys.modules; "
+            "from linkedin_scraper.display import display_error; "
+            "print(loaded, callable(display_error))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False True"
+
+    def test_unknown_export_raises_attribute_error(self) -> None:
+        """Names the package does not export should raise AttributeError."""
+        import linkedin_scraper.display as display
+
+        with pytest.raises(AttributeError):
+            _ = display.not_a_real_export
+
 
 class TestConnectionTableIntegration:
     """Integration tests for ConnectionTable with various profile scenarios."""
@@ -9,6 +9,7 @@ from rich.panel import Panel
 from linkedin_scraper.display.errors import (
     display_cookie_help,
     display_error,
+    display_network_error,
     display_rate_limit_exceeded,
 )
 from linkedin_scraper.errors import LinkedInScraperError
@@ -115,6 +116,10 @@ class TestDisplayCookieHelp:
         renderable_str = str(result.renderable)
         assert "linkedin" in renderable_str.lower()
 
+    def test_display_cookie_help_is_built_once(self) -> None:
+        """Test that the static cookie help panel is parsed and built only once."""
+        assert display_cookie_help() is display_cookie_help()
+
 
 class TestDisplayRateLimitExceeded:
     """Tests for the display_rate_limit_exceeded function."""
@@ -150,3 +155,28 @@ class TestDisplayRateLimitExceeded:
         result = display_rate_limit_exceeded(reset_time)
         renderable_str = str(result.renderable)
         assert "daily" in renderable_str.lower() or "limit" in renderable_str.lower()
+
+    def test_display_rate_limit_exceeded_shares_static_message(self) -> None:
+        """Test that the unchanging rate limit message is built once and reused."""
+        first = display_rate_limit_exceeded(datetime.now(UTC))
+        second = display_rate_limit_exceeded(datetime.now(UTC))
+        assert first.renderable is second.renderable
+
+
+class TestDisplayNetworkError:
+    """Tests for the display_network_error function."""
+
+    def test_display_network_error_shows_error_and_suggestions(self) -> None:
+        """Test that the error message precedes the shared suggestions."""
+        result = display_network_error(ConnectionError("timed out [retry]"))
+        renderable_str = str(result.renderable)
+        assert renderable_str.startswith("Network Error\n\ntimed out [retry]\n\n")
+        assert "Check your internet connection" in renderable_str
+
+    def test_display_network_error_leaves_suggestions_unchanged(self) -> None:
+        """Test that building one panel does not leak its error into the next."""
+        display_network_error(ConnectionError("first failure"))
+        result = display_network_error(ConnectionError("second failure"))
+        renderable_str = str(result.renderable)
+        assert "first failure" not in renderable_str
+        assert renderable_str.count("Suggestions:") == 1
@@ -501,6 +501,30 @@ class TestErrorHandling:
             with pytest.raises(LinkedInRateLimitError, match="Too many requests"):
                 orchestrator.execute_search(search_filter, account="default")
 
+    def test_exhausted_limit_fails_before_cookies_or_network(
+        self,
+        db_service: DatabaseService,
+        rate_limiter: RateLimiter,
+        mock_cookie_manager: mock.Mock,
+    ) -> None:
+        """Test that an exhausted daily limit raises before loading cookies or calling LinkedIn."""
+        for _ in range(25):
+            rate_limiter.record_action(ActionType.SEARCH)
+        orchestrator = SearchOrchestrator(
+            db_service=db_service,
+            rate_limiter=rate_limiter,
+            cookie_manager=mock_cookie_manager,
+        )
+
+        with (
+            mock.patch("linkedin_scraper.search.orchestrator.LinkedInClient") as mock_client_class,
+            pytest.raises(RateLimitExceeded),
+        ):
+            orchestrator.execute_search_with_company_name(keywords="engineer", company_name="Acme")
+
+        mock_cookie_manager.get_cookies.assert_not_called()
+        mock_client_class.assert_not_called()
+
 
 class TestGetRemainingActions:
     """Tests for get_remaining_actions helper method."""
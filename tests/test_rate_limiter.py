@@ -3,6 +3,7 @@
 
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -476,6 +477,24 @@ class TestCheckAndWait:
         # Should have waited on the second call
         assert len(sleep_called) >= 1
 
+    def test_ensure_can_perform_does_not_record(self, rate_limiter: RateLimiter) -> None:
+        """ensure_can_perform should pass under the limit without recording an action."""
+        rate_limiter.ensure_can_perform()
+
+        assert rate_limiter.get_actions_today() == 0
+
+    def test_ensure_can_perform_raises_at_limit(self, rate_limiter: RateLimiter) -> None:
+        """ensure_can_perform should raise RateLimitExceeded once the limit is reached."""
+        from linkedin_scraper.rate_limit.exceptions import RateLimitExceeded
+
+        for _ in range(5):
+            rate_limiter.record_action(ActionType.SEARCH)
+
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            rate_limiter.ensure_can_perform()
+
+        assert exc_info.value.reset_time is not None
+
     def test_check_and_wait_reset_time_in_exception(self, rate_limiter: RateLimiter) -> None:
         """RateLimitExceeded should include the reset time."""
         from linkedin_scraper.rate_limit.exceptions import RateLimitExceeded
@@ -490,3 +509,31 @@ class TestCheckAndWait:
         # Reset time should be tomorrow at midnight UTC
         assert exc_info.value.reset_time is not None
         assert exc_info.value.reset_time > datetime.now(UTC)
+
+    def test_check_and_wait_reads_rate_limit_history_once(
+        self,
+        rate_limiter: RateLimiter,
+        db_service: DatabaseService,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Should take the limit check and the delay from a single query."""
+        import time
+
+        monkeypatch.setattr(time, "sleep", lambda s: None)
+        rate_limiter.record_action(ActionType.SEARCH)
+
+        with (
+            patch.object(
+                db_service,
+                "summarize_rate_limit_entries_since",
+                wraps=db_service.summarize_rate_limit_entries_since,
+            ) as summarize,
+            patch.object(db_service, "count_rate_limit_entries_since") as count,
+            patch.object(db_service, "get_latest_rate_limit_timestamp") as latest,
+        ):
+            rate_limiter.check_and_wait(ActionType.SEARCH)
+
+        summarize.assert_called_once()
+        count.assert_not_called()
+        latest.assert_not_called()
+        assert rate_limiter.get_actions_today() == 2
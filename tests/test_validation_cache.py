@@ -0,0 +1,110 @@
+# ABOUTME: Tests for the session validation cache module.
+# ABOUTME: Covers TTL expiry, cookie fingerprint matching, invalidation, and bad files.
+
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from linkedin_scraper.auth import ValidationCache
+
+
+@pytest.fixture
+def cache_file() -> Path:
+    """Create a path for a validation cache file in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir) / "validation_cache.json"
+
+
+class TestValidationCache:
+    """Tests for ValidationCache."""
+
+    def test_unknown_account_is_not_valid(self, cache_file: Path) -> None:
+        """Test that an account with no entry is not considered valid."""
+        cache = ValidationCache(cache_file)
+        assert cache.is_valid("work", "li_at_value") is False
+
+    def test_mark_valid_round_trips(self, cache_file: Path) -> None:
+        """Test that a marked account is valid for the same cookie."""
+        cache = ValidationCache(cache_file)
+        cache.mark_valid("work", "li_at_value")
+
+        assert ValidationCache(cache_file).is_valid("work", "li_at_value") is True
+
+    def test_cookie_change_misses(self, cache_file: Path) -> None:
+        """Test that new cookies for an account do not reuse the old entry."""
+        cache = ValidationCache(cache_file)
+        cache.mark_valid("work", "old_li_at_value")
+
+        assert cache.is_valid("work", "new_li_at_value") is False
+
+    def test_entry_expires_after_ttl(self, cache_file: Path) -> None:
+        """Test that entries stop being trusted once the TTL has passed."""
+        cache = ValidationCache(cache_file, ttl_seconds=60)
+        with patch("linkedin_scraper.auth.validation_cache.time.time", return_value=1000.0):
+            cache.mark_valid("work", "li_at_value")
+        with patch("linkedin_scraper.auth.validation_cache.time.time", return_value=1059.0):
+            assert cache.is_valid("work", "li_at_value") is True
+        with patch("linkedin_scraper.auth.validation_cache.time.time", return_value=1061.0):
+            assert cache.is_valid("work", "li_at_value") is False
+
+    def test_invalidate_removes_entry(self, cache_file: Path) -> None:
+        """Test that invalidate drops only the given account."""
+        cache = ValidationCache(cache_file)
+        cache.mark_valid("work", "li_at_value")
+        cache.mark_valid("personal", "other_li_at")
+
+        cache.invalidate("work")
+
+        assert cache.is_valid("work", "li_at_value") is False
+        assert cache.is_valid("personal", "other_li_at") is True
+
+    def test_cookie_is_not_written_to_disk(self, cache_file: Path) -> None:
+        """Test that the cache file stores a fingerprint rather than the cookie."""
+        ValidationCache(cache_file).mark_valid("work", "secret_li_at_value")
+
+        content = cache_file.read_text()
+        assert "secret_li_at_value" not in content
+        assert "work" in json.loads(content)
+
+    def test_corrupt_file_is_treated_as_empty(self, cache_file: Path) -> None:
+        """Test that an unreadable cache file behaves like an empty cache."""
+        cache_file.write_text("not json")
+        cache = ValidationCache(cache_file)
+
+        assert cache.is_valid("work", "li_at_value") is False
+        cache.mark_valid("work", "li_at_value")
+        assert cache.is_valid("work", "li_at_value") is True
+
+    def test_unwritable_cache_is_ignored(self, cache_file: Path) -> None:
+        """Test that failing to write the cache never raises."""
+        cache_file.parent.joinpath("not_a_dir").write_text("")
+        blocked_file = cache_file.parent / "not_a_dir" / "validation_cache.json"
+        cache = ValidationCache(blocked_file)
+
+        cache.mark_valid("work", "li_at_value")
+        cache.invalidate("work")
+
+        assert cache.is_valid("work", "li_at_value") is False
+
+    def test_malformed_expiry_is_dropped_on_save(self, cache_file: Path) -> None:
+        """Test that an entry with a non-numeric expires_at is dropped, not fatal."""
+        stale = {"fingerprint": "x", "expires_at": "soon"}
+        cache_file.write_text(json.dumps({"stale": stale}))
+        cache = ValidationCache(cache_file)
+
+        assert cache.is_valid("stale", "li_at_value") is False
+        cache.mark_valid("work", "li_at_value")
+
+        assert cache.is_valid("work", "li_at_value") is True
+        assert "stale" not in json.loads(cache_file.read_text())
+
+    def test_save_leaves_no_temp_file(self, cache_file: Path) -> None:
+        """Test that each save moves its own temp file into place."""
+        cache = ValidationCache(cache_file)
+        cache.mark_valid("work", "li_at_value")
+        cache.invalidate("work")
+
+        assert list(cache_file.parent.glob(f"{cache_file.name}.*.tmp")) == []